@@ -4,8 +4,25 @@ __author__ = """Mike Gee"""
 __email__ = "mike@webtranspose.com"
 __version__ = "0.3.1"
 
-from .chat import *
-from .crawl import *
-from .openai import *
-from .scrape import *
-from .search import *
\ No newline at end of file
+from .chat import AsyncChatbot, Chatbot, get_chatbot, get_chatbot_async
+from .crawl import Crawl, get_crawl, list_crawls, retry_failed
+from .openai import OpenAIScraper
+from .scrape import Scraper, get_scraper, list_scrapers
+from .search import search, search_filter
+
+__all__ = [
+    "AsyncChatbot",
+    "Chatbot",
+    "Crawl",
+    "OpenAIScraper",
+    "Scraper",
+    "get_chatbot",
+    "get_chatbot_async",
+    "get_crawl",
+    "get_scraper",
+    "list_crawls",
+    "list_scrapers",
+    "retry_failed",
+    "search",
+    "search_filter",
+]
@@ -1,15 +1,184 @@
+import asyncio
 import logging
 import os
-from time import sleep
-from typing import List
+import random
+from collections import OrderedDict
+from itertools import chain, repeat
+from time import monotonic, sleep
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from .webt_api import run_webt_api
+from .webt_api import WebTransposeAPIError, run_webt_api, run_webt_api_async
 
+__all__ = [
+    "AsyncChatbot",
+    "Chatbot",
+    "get_chatbot",
+    "get_chatbot_async",
+]
+
+_POLL_SCHEDULE = (0.5, 1, 2, 3, 5, 8, 13)
+_MAX_POLL_DELAY = 15
+_STATUS_TTL = 0.5
+_MAX_WAIT = 60.0
+_QUERY_CACHE_TTL = 60.0
+_QUERY_CACHE_EMPTY_TTL = 10.0
+_QUERY_CACHE_SIZE = 256
+_ADD_URLS_CHUNK_SIZE = 1000
+
+# Cleared once the server answers a wait request in a way that shows it cannot wait for chatbots.
+_wait_supported = True
+
+# Maps (api_key, chatbot_id, query, num_records) to (expiry time, results), least recently used
+# first. The API key is part of the key so that results are only reused for the caller whose
+# request the server authorized.
+_query_cache: "OrderedDict[Tuple[str, str, str, int], Tuple[float, list]]" = OrderedDict()
+
+
+def _poll_delays(timeout: Optional[float] = None) -> Iterator[float]:
+    """
+    Yield the delays to sleep between polls of the Web Transpose API.
+
+    Delays follow ``_POLL_SCHEDULE`` and then stay at ``_MAX_POLL_DELAY``, each with up to 20%
+    jitter added. The last delay is cut short at the deadline, and the iterator ends once the
+    deadline has passed, so the caller still sees the result of the poll made at the deadline.
+
+    :param timeout: The maximum number of seconds to poll for. Polls forever if None.
+    """
+    deadline = None if timeout is None else monotonic() + timeout
+    for delay in chain(_POLL_SCHEDULE, repeat(_MAX_POLL_DELAY)):
+        delay += random.uniform(0, 0.2 * delay)
+        if deadline is not None:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return
+            delay = min(delay, remaining)
+        yield delay
+
+
+def _max_wait(deadline: Optional[float]) -> float:
+    """
+    Get how long the server may block waiting for a chatbot, bounded by a deadline.
+
+    :param deadline: The ``time.monotonic()`` value by which to stop waiting, if any.
+    :return: The maximum number of seconds to wait.
+    :raises TimeoutError: If the deadline has passed.
+    """
+    if deadline is None:
+        return _MAX_WAIT
+    remaining = deadline - monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Chat was not created before the timeout.")
+    return min(_MAX_WAIT, remaining)
+
+
+def _wait_failed(error: WebTransposeAPIError) -> bool:
+    """
+    Check whether a failed wait request should fall back to polling.
+
+    Any client error falls back, since an unknown route may be rejected with one of several status
+    codes. The server is remembered as unable to wait unless the error is about authentication or
+    rate limiting, which says nothing about the endpoint itself.
+
+    :param error: The error of the wait request.
+    :return: Whether to poll for the chatbot status instead.
+    """
+    global _wait_supported
+    if error.status_code != 501 and not 400 <= error.status_code < 500:
+        return False
+    if error.status_code not in (401, 403, 429):
+        _wait_supported = False
+    return True
+
+
+def _get_cached_query(key: Tuple[str, str, str, int]) -> Optional[list]:
+    """
+    Get the cached results of a database query.
+
+    :param key: The API key, chatbot ID, query and number of records.
+    :return: The query results, or None if they are not cached or have expired.
+    """
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    expiry, results = entry
+    if monotonic() >= expiry:
+        _query_cache.pop(key, None)
+        return None
+    _query_cache.move_to_end(key)
+    return list(results)
+
+
+def _cache_query(key: Tuple[str, str, str, int], results: list) -> None:
+    """
+    Cache the results of a database query, evicting the least recently used entries.
+
+    Empty results are cached for a shorter time than non-empty ones.
+
+    :param key: The API key, chatbot ID, query and number of records.
+    :param results: The query results.
+    """
+    ttl = _QUERY_CACHE_TTL if results else _QUERY_CACHE_EMPTY_TTL
+    _query_cache[key] = (monotonic() + ttl, list(results))
+    _query_cache.move_to_end(key)
+    while len(_query_cache) > _QUERY_CACHE_SIZE:
+        _query_cache.popitem(last=False)
+
+
+def _clear_cached_queries(chatbot_id: str) -> None:
+    """
+    Drop the cached query results of a chatbot.
+
+    :param chatbot_id: The ID of the chatbot.
+    """
+    for key in [key for key in list(_query_cache) if key[1] == chatbot_id]:
+        _query_cache.pop(key, None)
+
+
+def _unique_chunks(url_lists: Iterable[List[str]], chunk_size: int) -> Iterator[List[str]]:
+    """
+    Flatten lists of URLs, drop duplicates and split the result into chunks.
+
+    Chunks are yielded as soon as they fill up, so only one chunk is held at a time.
+
+    :param url_lists: The lists of URLs.
+    :param chunk_size: The maximum number of URLs per chunk.
+    :return: An iterator over the chunks of unique URLs.
+    """
+    seen = set()
+    chunk = []
+    for url in chain.from_iterable(url_lists):
+        if url in seen:
+            continue
+        seen.add(url)
+        chunk.append(url)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _BaseChatbot:
+    """
+    The state and local helpers shared by Chatbot and AsyncChatbot.
+    """
+
+    __slots__ = (
+        "api_key",
+        "url_list",
+        "name",
+        "max_pages",
+        "verbose",
+        "chatbot_id",
+        "created",
+        "_status_cache",
+        "_status_cache_ts",
+        "_ready",
+    )
 
-class Chatbot:
     def __init__(
         self,
-        url_list: List[str] = [],
+        url_list: Optional[List[str]] = None,
         name: str = None,
         max_pages: int = 100,
         api_key: str = None,
@@ -18,7 +187,7 @@ class Chatbot:
         _created: bool = False,
     ) -> None:
         """
-        Initialize a Chatbot instance.
+        Initialize the state of a chatbot.
 
         :param url_list: A list of URLs to crawl.
         :param name: The name of the chatbot.
@@ -37,31 +206,138 @@ class Chatbot:
                 "No Web Transpose API provided. \n\nTo use Chatbots, set the WEBTRANSPOSE_API_KEY from https://webtranspose.com."
             )
 
-        self.url_list = url_list
+        self.url_list = [] if url_list is None else list(url_list)
         self.name = name
         self.max_pages = max_pages
         self.verbose = verbose
         self.chatbot_id = chatbot_id
         self.created = _created
+        self._status_cache = None
+        self._status_cache_ts = 0.0
+        self._ready = bool(self.chatbot_id)
 
-        if not self.chatbot_id:
+    def _get_cached_status(self, force: bool = False) -> Optional[dict]:
+        """
+        Get the status fetched within the last ``_STATUS_TTL`` seconds, if any.
+
+        :param force: Whether to skip the cached status.
+        :return: The cached chatbot status, or None if it must be fetched.
+        """
+        if (
+            not force
+            and self._status_cache is not None
+            and monotonic() - self._status_cache_ts < _STATUS_TTL
+        ):
+            return self._status_cache
+        return None
+
+    def _cache_status(self, status: dict) -> dict:
+        """
+        Cache a freshly fetched status of the chatbot.
+
+        :param status: The chatbot status.
+        :return: The chatbot status.
+        """
+        self._status_cache = status
+        self._status_cache_ts = monotonic()
+        if status["status"] == "complete":
+            self.created = True
+        return status
+
+    def _invalidate_caches(self) -> None:
+        """
+        Drop the cached status and query results after the chatbot's contents change.
+        """
+        self._status_cache_ts = 0.0
+        _clear_cached_queries(self.chatbot_id)
+
+
+class Chatbot(_BaseChatbot):
+    __slots__ = ()
+
+    def __init__(
+        self,
+        url_list: Optional[List[str]] = None,
+        name: str = None,
+        max_pages: int = 100,
+        api_key: str = None,
+        verbose: bool = False,
+        chatbot_id: str = None,
+        _created: bool = False,
+    ) -> None:
+        """
+        Initialize a Chatbot instance.
+
+        :param url_list: A list of URLs to crawl.
+        :param name: The name of the chatbot.
+        :param max_pages: The maximum number of pages to crawl.
+        :param api_key: The API key for accessing the Web Transpose API.
+        :param verbose: Whether to enable verbose logging.
+        :param chatbot_id: The ID of an existing chatbot.
+        :param _created: Whether the chatbot has already been created.
+        """
+        super().__init__(url_list, name, max_pages, api_key, verbose, chatbot_id, _created)
+
+        if not self._ready:
             self.create()
 
-    def create(self):
+    def create(self, timeout: Optional[float] = None):
         """
         Create a chatbot.
+
+        :param timeout: The maximum number of seconds to wait for the chatbot to be created.
+        :raises TimeoutError: If the chatbot is not created within ``timeout`` seconds.
         """
         if not self.chatbot_id:
             self._create_chat()
-            status = self.status()
-            while status["status"] != "complete":
+            deadline = None if timeout is None else monotonic() + timeout
+            status = self._wait_for_complete(_max_wait(deadline))
+            while status is not None and status["status"] != "complete":
                 if self.verbose:
                     logging.info("Waiting for chat to be created...")
-                sleep(5)
-                status = self.status()
+                status = self._wait_for_complete(_max_wait(deadline))
+
+            if status is None:
+                self._poll_for_complete(None if deadline is None else deadline - monotonic())
 
         else:
             logging.info("Chat already created.")
+        self._ready = True
+
+    def _wait_for_complete(self, max_wait: float = _MAX_WAIT) -> Optional[dict]:
+        """
+        Wait on the server until the chatbot is complete or ``max_wait`` seconds have passed.
+
+        :param max_wait: The maximum number of seconds for the server to wait.
+        :return: The chatbot status, or None if the server does not support waiting.
+        """
+        if not _wait_supported:
+            return None
+        try:
+            out = self._post("v1/chat/wait", timeout=max_wait + 5, max_wait=max_wait)
+        except WebTransposeAPIError as e:
+            if _wait_failed(e):
+                return None
+            raise
+        return self._cache_status(out["chatbot"])
+
+    def _poll_for_complete(self, timeout: Optional[float] = None):
+        """
+        Poll the status of the chatbot until it is complete.
+
+        :param timeout: The maximum number of seconds to poll for.
+        :raises TimeoutError: If the chatbot is not complete within ``timeout`` seconds.
+        """
+        status = self.status(force=True)
+        for delay in _poll_delays(timeout):
+            if status["status"] == "complete":
+                return
+            if self.verbose:
+                logging.info("Waiting for chat to be created...")
+            sleep(delay)
+            status = self.status(force=True)
+        if status["status"] != "complete":
+            raise TimeoutError("Chat was not created before the timeout.")
 
     def queue_create(self):
         """
@@ -72,61 +348,81 @@ class Chatbot:
         else:
             logging.info("Chat already created.")
 
+    def _post(self, api_path: str, timeout: float = 180, **params) -> dict:
+        """
+        Run a Web Transpose API request for this chatbot.
+
+        :param api_path: The API path.
+        :param timeout: The request timeout in seconds.
+        :param params: The parameters for the API request, besides the chatbot ID.
+        :return: The JSON response from the API.
+        """
+        return run_webt_api(
+            {"chatbot_id": self.chatbot_id, **params}, api_path, self.api_key, timeout=timeout
+        )
+
     def _create_chat(self):
         """
         Create a chat.
         """
+        self._status_cache_ts = 0.0
         if self.verbose:
             logging.info("Creating chat...")
 
-        if self.chatbot_id is None:
-            create_json = {
-                "name": self.name,
-                "max_pages": self.max_pages,
-                "url_list": self.url_list,
-            }
-            out_json = run_webt_api(create_json, "v1/chat/create", self.api_key)
-            self.chatbot_id = out_json["chatbot_id"]
+        create_json = {
+            "name": self.name,
+            "max_pages": self.max_pages,
+            "url_list": self.url_list,
+        }
+        out_json = run_webt_api(create_json, "v1/chat/create", self.api_key)
+        self.chatbot_id = out_json["chatbot_id"]
 
-    def query_database(self, query: str, num_records: int = 3) -> list:
+    def query_database(self, query: str, num_records: int = 3, cache: bool = True) -> list:
         """
         Query the database of the chatbot.
 
         :param query: The query string.
         :param num_records: The number of records to return.
+        :param cache: Whether to reuse the results of an identical recent query.
         :return: The query results.
         """
         if self.verbose:
             logging.info("Querying database...")
 
-        if not self.chatbot_id:
+        if not self._ready:
             self.create()
 
-        query_json = {
-            "chatbot_id": self.chatbot_id,
-            "query": query,
-            "num_records": num_records,
-        }
-        out = run_webt_api(query_json, "v1/chat/database/query", self.api_key)
+        key = (self.api_key, self.chatbot_id, query, num_records)
+        if cache:
+            results = _get_cached_query(key)
+            if results is not None:
+                return results
+
+        out = self._post("v1/chat/database/query", query=query, num_records=num_records)
+        _cache_query(key, out["results"])
         return out["results"]
 
-    def status(self):
+    def status(self, force: bool = False):
         """
         Get the status of the chatbot.
 
+        Statuses fetched within the last ``_STATUS_TTL`` seconds are reused.
+
+        :param force: Whether to skip the cached status.
         :return: The chatbot status.
         """
+        status = self._get_cached_status(force)
+        if status is not None:
+            return status
+
         if self.verbose:
             logging.info("Getting chat...")
 
         if not self.chatbot_id:
             self.create()
 
-        get_json = {
-            "chatbot_id": self.chatbot_id,
-        }
-        out = run_webt_api(get_json, "v1/chat/get", self.api_key)
-        return out["chatbot"]
+        out = self._post("v1/chat/get")
+        return self._cache_status(out["chatbot"])
 
     def add_urls(self, url_list: list):
         """
@@ -134,18 +430,28 @@ class Chatbot:
 
         :param url_list: A list of URLs to add.
         """
+        self.add_urls_bulk([url_list])
+
+    def add_urls_bulk(
+        self, url_lists: Iterable[List[str]], chunk_size: int = _ADD_URLS_CHUNK_SIZE
+    ):
+        """
+        Add several lists of URLs to the chatbot in as few requests as possible.
+
+        Duplicate URLs are only sent once.
+
+        :param url_lists: The lists of URLs to add.
+        :param chunk_size: The maximum number of URLs to send per request.
+        """
+        self._invalidate_caches()
         if self.verbose:
-            logging.info("Querying database...")
+            logging.info("Adding URLs...")
 
-        if not self.chatbot_id:
+        if not self._ready:
             self.create()
 
-        query_json = {
-            "chatbot_id": self.chatbot_id,
-            "max_pages": self.max_pages,
-            "url_list": url_list,
-        }
-        run_webt_api(query_json, "v1/chat/urls/add", self.api_key)
+        for url_chunk in _unique_chunks(url_lists, chunk_size):
+            self._post("v1/chat/urls/add", max_pages=self.max_pages, url_list=url_chunk)
 
     def delete_crawls(self, crawl_id_list: list):
         """
@@ -153,17 +459,259 @@ class Chatbot:
 
         :param crawl_id_list: A list of crawl IDs to delete.
         """
+        self._invalidate_caches()
         if self.verbose:
             logging.info("Querying database...")
 
-        if not self.chatbot_id:
+        if not self._ready:
             self.create()
 
-        query_json = {
-            "chatbot_id": self.chatbot_id,
-            "crawl_id_list": crawl_id_list,
+        self._post("v1/chat/crawls/delete", crawl_id_list=crawl_id_list)
+
+
+class AsyncChatbot(_BaseChatbot):
+    __slots__ = ("_create_lock",)
+
+    def __init__(
+        self,
+        url_list: Optional[List[str]] = None,
+        name: str = None,
+        max_pages: int = 100,
+        api_key: str = None,
+        verbose: bool = False,
+        chatbot_id: str = None,
+        _created: bool = False,
+    ) -> None:
+        """
+        Initialize an AsyncChatbot instance.
+
+        Unlike Chatbot, the chatbot is not created on initialization. Await ``create()`` or any
+        other method to create it.
+
+        :param url_list: A list of URLs to crawl.
+        :param name: The name of the chatbot.
+        :param max_pages: The maximum number of pages to crawl.
+        :param api_key: The API key for accessing the Web Transpose API.
+        :param verbose: Whether to enable verbose logging.
+        :param chatbot_id: The ID of an existing chatbot.
+        :param _created: Whether the chatbot has already been created.
+        """
+        super().__init__(url_list, name, max_pages, api_key, verbose, chatbot_id, _created)
+        self._create_lock = None
+
+    def _get_create_lock(self) -> asyncio.Lock:
+        """
+        Get the lock that lets only one task create the chatbot, creating it on first use.
+
+        The lock is created inside a running event loop, which older Python versions bind it to.
+
+        :return: The lock.
+        """
+        if self._create_lock is None:
+            self._create_lock = asyncio.Lock()
+        return self._create_lock
+
+    async def create(self, timeout: Optional[float] = None):
+        """
+        Create a chatbot.
+
+        Concurrent calls create a single chatbot. Calls that wait for another one to finish
+        creating it return once it is ready.
+
+        :param timeout: The maximum number of seconds to wait for the chatbot to be created.
+        :raises TimeoutError: If the chatbot is not created within ``timeout`` seconds.
+        """
+        create_lock = self._get_create_lock()
+        waited = create_lock.locked()
+        async with create_lock:
+            if waited and self._ready:
+                return
+            if not self.chatbot_id:
+                await self._create_chat()
+                deadline = None if timeout is None else monotonic() + timeout
+                status = await self._wait_for_complete(_max_wait(deadline))
+                while status is not None and status["status"] != "complete":
+                    if self.verbose:
+                        logging.info("Waiting for chat to be created...")
+                    status = await self._wait_for_complete(_max_wait(deadline))
+
+                if status is None:
+                    await self._poll_for_complete(
+                        None if deadline is None else deadline - monotonic()
+                    )
+
+            else:
+                logging.info("Chat already created.")
+            self._ready = True
+
+    async def _wait_for_complete(self, max_wait: float = _MAX_WAIT) -> Optional[dict]:
+        """
+        Wait on the server until the chatbot is complete or ``max_wait`` seconds have passed.
+
+        :param max_wait: The maximum number of seconds for the server to wait.
+        :return: The chatbot status, or None if the server does not support waiting.
+        """
+        if not _wait_supported:
+            return None
+        try:
+            out = await self._post("v1/chat/wait", timeout=max_wait + 5, max_wait=max_wait)
+        except WebTransposeAPIError as e:
+            if _wait_failed(e):
+                return None
+            raise
+        return self._cache_status(out["chatbot"])
+
+    async def _poll_for_complete(self, timeout: Optional[float] = None):
+        """
+        Poll the status of the chatbot until it is complete.
+
+        :param timeout: The maximum number of seconds to poll for.
+        :raises TimeoutError: If the chatbot is not complete within ``timeout`` seconds.
+        """
+        status = await self.status(force=True)
+        for delay in _poll_delays(timeout):
+            if status["status"] == "complete":
+                return
+            if self.verbose:
+                logging.info("Waiting for chat to be created...")
+            await asyncio.sleep(delay)
+            status = await self.status(force=True)
+        if status["status"] != "complete":
+            raise TimeoutError("Chat was not created before the timeout.")
+
+    async def queue_create(self):
+        """
+        Queue the creation of a chatbot.
+        """
+        async with self._get_create_lock():
+            if not self.chatbot_id:
+                await self._create_chat()
+            else:
+                logging.info("Chat already created.")
+
+    async def _post(self, api_path: str, timeout: float = 180, **params) -> dict:
+        """
+        Run a Web Transpose API request for this chatbot.
+
+        :param api_path: The API path.
+        :param timeout: The request timeout in seconds.
+        :param params: The parameters for the API request, besides the chatbot ID.
+        :return: The JSON response from the API.
+        """
+        return await run_webt_api_async(
+            {"chatbot_id": self.chatbot_id, **params}, api_path, self.api_key, timeout=timeout
+        )
+
+    async def _create_chat(self):
+        """
+        Create a chat.
+        """
+        self._status_cache_ts = 0.0
+        if self.verbose:
+            logging.info("Creating chat...")
+
+        create_json = {
+            "name": self.name,
+            "max_pages": self.max_pages,
+            "url_list": self.url_list,
         }
-        run_webt_api(query_json, "v1/chat/crawls/delete", self.api_key)
+        out_json = await run_webt_api_async(create_json, "v1/chat/create", self.api_key)
+        self.chatbot_id = out_json["chatbot_id"]
+
+    async def query_database(self, query: str, num_records: int = 3, cache: bool = True) -> list:
+        """
+        Query the database of the chatbot.
+
+        :param query: The query string.
+        :param num_records: The number of records to return.
+        :param cache: Whether to reuse the results of an identical recent query.
+        :return: The query results.
+        """
+        if self.verbose:
+            logging.info("Querying database...")
+
+        if not self._ready:
+            await self.create()
+
+        key = (self.api_key, self.chatbot_id, query, num_records)
+        if cache:
+            results = _get_cached_query(key)
+            if results is not None:
+                return results
+
+        out = await self._post("v1/chat/database/query", query=query, num_records=num_records)
+        _cache_query(key, out["results"])
+        return out["results"]
+
+    async def status(self, force: bool = False):
+        """
+        Get the status of the chatbot.
+
+        Statuses fetched within the last ``_STATUS_TTL`` seconds are reused.
+
+        :param force: Whether to skip the cached status.
+        :return: The chatbot status.
+        """
+        status = self._get_cached_status(force)
+        if status is not None:
+            return status
+
+        if self.verbose:
+            logging.info("Getting chat...")
+
+        if not self.chatbot_id:
+            await self.create()
+
+        out = await self._post("v1/chat/get")
+        return self._cache_status(out["chatbot"])
+
+    async def add_urls(self, url_list: list):
+        """
+        Add URLs to the chatbot.
+
+        :param url_list: A list of URLs to add.
+        """
+        await self.add_urls_bulk([url_list])
+
+    async def add_urls_bulk(
+        self, url_lists: Iterable[List[str]], chunk_size: int = _ADD_URLS_CHUNK_SIZE
+    ):
+        """
+        Add several lists of URLs to the chatbot in as few requests as possible.
+
+        Duplicate URLs are only sent once, and the requests are sent concurrently.
+
+        :param url_lists: The lists of URLs to add.
+        :param chunk_size: The maximum number of URLs to send per request.
+        """
+        self._invalidate_caches()
+        if self.verbose:
+            logging.info("Adding URLs...")
+
+        if not self._ready:
+            await self.create()
+
+        await asyncio.gather(
+            *(
+                self._post("v1/chat/urls/add", max_pages=self.max_pages, url_list=url_chunk)
+                for url_chunk in _unique_chunks(url_lists, chunk_size)
+            )
+        )
+
+    async def delete_crawls(self, crawl_id_list: list):
+        """
+        Delete crawls from the chatbot.
+
+        :param crawl_id_list: A list of crawl IDs to delete.
+        """
+        self._invalidate_caches()
+        if self.verbose:
+            logging.info("Querying database...")
+
+        if not self._ready:
+            await self.create()
+
+        await self._post("v1/chat/crawls/delete", crawl_id_list=crawl_id_list)
 
 
 def get_chatbot(chatbot_id: str, api_key = None) -> Chatbot:
@@ -191,4 +739,33 @@ def get_chatbot(chatbot_id: str, api_key = None) -> Chatbot:
         verbose=False,
         _created=True
     )
-    return chatbot
\ No newline at end of file
+    return chatbot
+
+
+async def get_chatbot_async(chatbot_id: str, api_key=None) -> AsyncChatbot:
+    """
+    Get a chatbot without blocking the event loop.
+
+    :param chatbot_id: The ID of the chatbot.
+    :return: The chatbot.
+    """
+    if api_key is None:
+        api_key = os.environ.get("WEBTRANSPOSE_API_KEY")
+        if api_key is None:
+            raise ValueError(
+                "No Web Transpose API provided. \n\nTo use Chatbots, set the WEBTRANSPOSE_API_KEY from https://webtranspose.com."
+            )
+    get_json = {
+        "chatbot_id": chatbot_id,
+    }
+    chat_json = await run_webt_api_async(get_json, "v1/chat/get", api_key)
+    chatbot_data = chat_json.get("chatbot", {})
+    chatbot = AsyncChatbot(
+        chatbot_id=chatbot_data.get("id"),
+        name=chatbot_data.get("name"),
+        max_pages=chatbot_data.get("num_run", 100),
+        api_key=api_key,
+        verbose=False,
+        _created=True,
+    )
+    return chatbot
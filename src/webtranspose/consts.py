@@ -0,0 +1 @@
+WEBTRANSPOSE_API_URL = "https://api.webtranspose.com/"
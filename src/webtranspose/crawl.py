@@ -1,21 +1,357 @@
 import asyncio
-import json
+import codecs
+import gzip
+import hashlib
 import logging
 import os
-import shutil
-import tempfile
-import urllib.parse
+import re
+import time
 import uuid
-import zipfile
+from collections import deque
 from datetime import datetime
-from fnmatch import fnmatch
-from typing import Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse, urlunparse
+from fnmatch import translate
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
 
-from .webt_api import run_webt_api
+from .webt_api import _HTTP2_AVAILABLE, _json_dumps, _json_loads, run_webt_api
+
+__all__ = [
+    "Crawl",
+    "get_crawl",
+    "list_crawls",
+    "retry_failed",
+]
+
+
+# A queue entry is a (url, parent entry) pair, so the entries form linked chains of parent URLs
+# that children share instead of each copying their parent's list.
+_QueueEntry = Tuple[str, Optional[tuple]]
+
+
+def _make_entry(url: str, parent_urls: List[str]) -> _QueueEntry:
+    """
+    Build a queue entry from a URL and the list of its parent URLs.
+
+    :param url: The URL to crawl.
+    :param parent_urls: The parent URLs, starting from the base URL.
+    :return: The queue entry.
+    """
+    parent = None
+    for parent_url in parent_urls:
+        parent = (parent_url, parent)
+    return (url, parent)
+
+
+def _parent_urls(parent: Optional[_QueueEntry]) -> List[str]:
+    """
+    Walk a chain of parent entries into a list of URLs.
+
+    :param parent: The entry of the parent page, or None for the base URL.
+    :return: The parent URLs, starting from the base URL.
+    """
+    urls = []
+    while parent is not None:
+        url, parent = parent
+        urls.append(url)
+    urls.reverse()
+    return urls
+
+
+def _entry_to_dict(entry: _QueueEntry) -> dict:
+    """
+    Convert a queue entry to its serialized form.
+
+    :param entry: The queue entry.
+    :return: The URL and its list of parent URLs.
+    """
+    return {
+        "url": entry[0],
+        "parent_urls": _parent_urls(entry[1]),
+    }
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[Pattern]:
+    """
+    Compile a list of glob patterns into a single regular expression.
+
+    :param patterns: The glob patterns, in the syntax accepted by ``fnmatch``.
+    :return: A pattern matching any of the globs, or None if there are no globs.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
+# Actions for a dequeued URL, as returned by _classify_url.
+_CRAWL_URL = 0
+_DEFER_URL = 1
+_IGNORE_URL = 2
+
+
+def _classify_url(
+    url: str,
+    base_url_netloc: str,
+    allowed_re: Optional[Pattern],
+    banned_re: Optional[Pattern],
+    visited_urls: Dict[str, str],
+) -> int:
+    """
+    Decide what a crawl worker should do with a URL.
+
+    This is plain, fully annotated Python with no async code, so it can be compiled with mypyc.
+
+    :param url: The URL to classify.
+    :param base_url_netloc: The network location of the base URL of the crawl.
+    :param allowed_re: A compiled pattern of allowed URLs to crawl, if any.
+    :param banned_re: A compiled pattern of banned URLs to exclude from crawling, if any.
+    :param visited_urls: A dictionary of visited URLs and their file paths.
+    :return: _CRAWL_URL if the URL can be crawled, _DEFER_URL if it should be kept in the queue
+        for a later crawl, or _IGNORE_URL if it should be ignored.
+    """
+    if url in visited_urls:
+        return _IGNORE_URL
+    is_allowed = allowed_re is not None and allowed_re.match(url) is not None
+    if urlsplit(url).netloc == base_url_netloc:
+        if is_allowed or banned_re is None or banned_re.match(url) is None:
+            return _CRAWL_URL
+        return _DEFER_URL
+    if is_allowed:
+        return _CRAWL_URL
+    return _IGNORE_URL
+
+
+@lru_cache(maxsize=4096)
+def _resolve_url(base_url: str, href: str) -> str:
+    """
+    Resolve a link against a base URL and remove its fragment component.
+
+    Pages on a site mostly link to the same URLs, so results are cached.
+
+    :param base_url: The URL to resolve the link against.
+    :param href: The link to resolve.
+    :return: The absolute URL without a fragment.
+    """
+    return urldefrag(urljoin(base_url, href))[0]
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """
+    Format a Unix timestamp as a local ISO 8601 date.
+
+    Pages crawled within the same second share the formatted value.
+
+    :param seconds: The whole number of seconds since the epoch.
+    :return: The ISO 8601 date.
+    """
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def _url_filename(url: str) -> str:
+    """
+    Get the name of the file that stores a crawled page.
+
+    Names are a hash of the URL, so they have a fixed length however long the URL is.
+
+    :param url: The URL of the page.
+    :return: The filename of the page.
+    """
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest() + ".json"
+
+
+_DECODE_CHUNK_SIZE = 64 * 1024
+
+
+def _check_decodable(content: bytes, encoding: str) -> None:
+    """
+    Check that a response body is text in the given encoding.
+
+    The body is decoded in chunks and the output discarded, so no decoded copy of the page is held.
+
+    :param content: The response body.
+    :param encoding: The encoding of the body.
+    :raises UnicodeDecodeError: If the body is not valid in the encoding.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    view = memoryview(content)
+    for start in range(0, len(view), _DECODE_CHUNK_SIZE):
+        decoder.decode(view[start : start + _DECODE_CHUNK_SIZE])
+    decoder.decode(b"", final=True)
+
+
+def _read_json(filepath: str):
+    """
+    Read a JSON document from a file.
+
+    :param filepath: The path of the file to read.
+    :return: The deserialized data.
+    """
+    with open(filepath, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _write_json(filepath: str, data: dict) -> None:
+    """
+    Write a JSON document to a file.
+
+    :param filepath: The path of the file to write.
+    :param data: The data to serialize.
+    """
+    with open(filepath, "wb") as f:
+        f.write(_json_dumps(data))
+
+
+def _write_page(filepath: str, data: dict, content: Optional[bytes]) -> None:
+    """
+    Write a crawled page to disk.
+
+    The raw HTML is compressed into a sidecar file named in ``data["html_file"]`` so that the JSON
+    document stays small.
+
+    :param filepath: The path of the JSON file to write.
+    :param data: The page data.
+    :param content: The raw HTML of the page, or None if it is not an HTML page.
+    """
+    if content is not None:
+        html_filepath = os.path.join(os.path.dirname(filepath), data["html_file"])
+        with gzip.open(html_filepath, "wb", compresslevel=6) as f:
+            f.write(content)
+    _write_json(filepath, data)
+
+
+class _CrawlQueue:
+    """
+    A FIFO queue of crawl entries with the task tracking of ``asyncio.Queue``.
+
+    Items live in a plain deque and waiting consumers are only woken when there are items for
+    them, so enqueueing a page's links costs little more than appending them. Waiters are futures
+    of the running loop, which lets a queue built outside a loop be crawled later.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """
+        Initialize the queue.
+
+        :param items: The initial items of the queue.
+        """
+        self._queue: Deque[Any] = deque(items)
+        self._unfinished_tasks = len(self._queue)
+        self._getters: Deque[asyncio.Future] = deque()
+        self._joiners: List[asyncio.Future] = []
+
+    def qsize(self) -> int:
+        """
+        :return: The number of items in the queue.
+        """
+        return len(self._queue)
+
+    def empty(self) -> bool:
+        """
+        :return: Whether the queue has no items.
+        """
+        return not self._queue
+
+    def peek(self, n: Optional[int] = None) -> list:
+        """
+        Get items from the front of the queue without removing them.
+
+        :param n: The maximum number of items to return, or None for all of them.
+        :return: The items, oldest first.
+        """
+        return list(islice(self._queue, n))
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Add an item to the end of the queue.
+
+        :param item: The item to add.
+        """
+        self._queue.append(item)
+        self._unfinished_tasks += 1
+        self._wake_getters()
+
+    def put_many_nowait(self, items: Iterable[Any]) -> None:
+        """
+        Add items to the end of the queue, waking waiting consumers once for the whole batch.
+
+        :param items: The items to add.
+        """
+        n = len(self._queue)
+        self._queue.extend(items)
+        self._unfinished_tasks += len(self._queue) - n
+        self._wake_getters()
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the item at the front of the queue.
+
+        :return: The item.
+        :raises asyncio.QueueEmpty: If the queue is empty.
+        """
+        if not self._queue:
+            raise asyncio.QueueEmpty
+        return self._queue.popleft()
+
+    async def get(self) -> Any:
+        """
+        Remove and return the item at the front of the queue, waiting until one is available.
+
+        :return: The item.
+        """
+        while not self._queue:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                # Pass the wakeup on if this getter was woken for an item it will not take.
+                self._wake_getters()
+                raise
+        return self._queue.popleft()
+
+    def task_done(self) -> None:
+        """
+        Mark an item taken from the queue as processed.
+
+        :raises ValueError: If called more times than there were items in the queue.
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            joiners, self._joiners = self._joiners, []
+            for joiner in joiners:
+                if not joiner.done():
+                    joiner.set_result(None)
+
+    async def join(self) -> None:
+        """
+        Wait until every item put in the queue has been processed.
+        """
+        if self._unfinished_tasks > 0:
+            joiner = asyncio.get_running_loop().create_future()
+            self._joiners.append(joiner)
+            await joiner
+
+    def _wake_getters(self) -> None:
+        """
+        Wake one waiting consumer for each item in the queue.
+        """
+        n = len(self._queue)
+        while n > 0 and self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                n -= 1
 
 
 class Crawl:
@@ -53,20 +389,13 @@ class Crawl:
         self.allowed_urls = allowed_urls
         self.banned_urls = banned_urls
         self.max_pages = max_pages
-        self.queue = asyncio.Queue()
-        self.queue.put_nowait(
-            {
-                "url": self.base_url,
-                "parent_urls": [],
-            }
-        )
+        self.queue = _CrawlQueue([(self.base_url, None)])
         self.output_dir = output_dir
         self.visited_urls = {}
         self.failed_urls = set()
         self.ignored_urls = set()
         self.n_workers = n_workers
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
         self.created = _created
         self.render_js = render_js
         self.crawl_id = None
@@ -83,132 +412,143 @@ class Crawl:
     @staticmethod
     async def crawl_worker(
         name: str,
-        queue: asyncio.Queue,
+        queue: _CrawlQueue,
         crawl_id: str,
         visited_urls: Dict[str, str],
-        allowed_urls: List[str],
+        seen_urls: Set[str],
+        allowed_re: Optional[Pattern],
         failed_urls: Set[str],
-        banned_urls: List[str],
+        banned_re: Optional[Pattern],
         output_dir: str,
         base_url: str,
-        max_pages: int,
-        leftover_queue: asyncio.Queue,
-        ignored_queue: asyncio.Queue,
+        page_budget: Optional[asyncio.Semaphore],
+        leftover_queue: _CrawlQueue,
+        ignored_queue: _CrawlQueue,
         verbose: bool,
+        client: httpx.AsyncClient,
     ) -> None:
         """
         Worker function for crawling URLs.
 
         :param name: The name of the worker.
-        :param queue: The queue of URLs to crawl.
+        :param queue: The queue of URLs to crawl. A None entry tells the worker to stop.
         :param crawl_id: The ID of the crawl.
         :param visited_urls: A dictionary of visited URLs and their file paths.
-        :param allowed_urls: A list of allowed URLs to crawl.
-        :param banned_urls: A list of banned URLs to exclude from crawling.
+        :param seen_urls: The set of URLs that have been queued or visited, shared by all workers.
+        :param allowed_re: A compiled pattern of allowed URLs to crawl, if any.
+        :param banned_re: A compiled pattern of banned URLs to exclude from crawling, if any.
         :param output_dir: The directory to store the crawled data.
         :param base_url: The base URL of the crawl.
-        :param max_pages: The maximum number of pages to crawl.
+        :param page_budget: The number of pages left to crawl, shared by all workers, or None for
+            no limit.
         :param leftover_queue: The queue for leftover URLs.
         :param ignored_queue: The queue for ignored URLs.
         :param verbose: Whether to print verbose logging messages.
+        :param client: The HTTP client shared by all workers.
         """
-
-        def _lint_url(url: str) -> str:
-            """
-            Lint the given URL by removing the fragment component.
-
-            :param url: The URL to lint.
-            :return: The linted URL.
-            """
-            parsed_url = urlparse(url)
-            cleaned_url = parsed_url._replace(fragment="")
-            return urlunparse(cleaned_url)
+        from lxml import etree
+        from lxml import html as lxml_html
 
         if verbose:
             logging.info(f"{name}: Starting crawl of {base_url}")
-        while max_pages is None or len(visited_urls) < max_pages or not queue.empty():
-            curr_url_data = await queue.get()
-            curr_url = curr_url_data["url"]
-            parent_urls = curr_url_data["parent_urls"]
-            base_url_netloc = urlparse(base_url).netloc
-            if (
-                (
-                    (
-                        urlparse(curr_url).netloc == base_url_netloc
-                        and not any(fnmatch(curr_url, banned) for banned in banned_urls)
+        loop = asyncio.get_running_loop()
+        # Selecting the attribute values directly skips creating a Python proxy for each element.
+        # Plain strings are requested because lxml's default smart strings keep a reference to
+        # their document, which the URL cache and the seen set would then keep alive.
+        find_hrefs = etree.XPath("//@href", smart_strings=False)
+        base_url_netloc = urlparse(base_url).netloc
+        base_dir = os.path.join(output_dir, base_url_netloc)
+        os.makedirs(base_dir, exist_ok=True)
+        while True:
+            curr_entry = await queue.get()
+            if curr_entry is None:
+                queue.task_done()
+                return
+            curr_url, parent = curr_entry
+            action = _classify_url(curr_url, base_url_netloc, allowed_re, banned_re, visited_urls)
+            if action == _CRAWL_URL and (page_budget is None or not page_budget.locked()):
+                # Reserve the page before fetching so concurrent workers cannot overshoot the
+                # budget. Acquiring an unlocked semaphore does not suspend.
+                if page_budget is not None:
+                    await page_budget.acquire()
+                filepath = os.path.join(base_dir, _url_filename(curr_url))
+                try:
+                    page = await client.get(curr_url)
+                except:
+                    failed_urls.add(curr_url)
+                    if page_budget is not None:
+                        page_budget.release()
+                    queue.task_done()
+                    continue
+
+                page_title = None
+                page_text = None
+                html_content = None
+                # The same encoding checks, parses and later restores the page, so the stored
+                # text and the stored HTML always agree.
+                encoding = page.encoding
+                try:
+                    page_type = "html"
+                    # Binary responses do not decode with the declared charset and are typed as other.
+                    _check_decodable(page.content, encoding)
+                    # Without an explicit encoding lxml only honours a <meta> charset and otherwise
+                    # guesses Latin-1, garbling pages whose charset is only known from the response.
+                    tree = lxml_html.document_fromstring(
+                        page.content, parser=lxml_html.HTMLParser(encoding=encoding)
                     )
-                    or any(fnmatch(curr_url, allowed) for allowed in allowed_urls)
-                )
-                and curr_url not in visited_urls
-                and len(visited_urls) < max_pages
-            ):
-                base_dir = os.path.join(output_dir, base_url_netloc)
-                if not os.path.exists(base_dir):
-                    os.makedirs(base_dir)
-                filename = urllib.parse.quote_plus(curr_url).replace("/", "_")
-                filepath = os.path.join(base_dir, filename) + ".json"
-                async with httpx.AsyncClient() as client:
-                    try:
-                        page = await client.get(curr_url)
-                    except:
-                        failed_urls.add(curr_url)
-                        queue.task_done()
-                        continue
-
-                    page_title = None
-                    page_html = None
-                    page_text = None
-                    try:
-                        page_type = "html"
-                        soup = BeautifulSoup(page.content, "lxml")
-                        page_title = soup.title.string if soup.title else ""
-                        page_html = page.content.decode("utf-8")
-                        page_text = soup.get_text()
-                        child_urls = list(
-                            set(
-                                [
-                                    _lint_url(urljoin(base_url, link.get("href")))
-                                    for link in soup.find_all(href=True)
-                                ]
-                            )
+                    page_title = tree.findtext(".//title") or ""
+                    html_content = page.content
+                    # Serializing as text walks the tree once in C and returns a plain string.
+                    page_text = etree.tostring(tree, method="text", encoding="unicode")
+                    child_urls_set = {_resolve_url(base_url, href) for href in find_hrefs(tree)}
+                    child_urls = list(child_urls_set)
+                    new_urls = [
+                        url
+                        for url in child_urls
+                        if url.startswith("http") and url not in seen_urls
+                    ]
+                    seen_urls.update(new_urls)
+                    # Off-site links that are not allowed can never be crawled, so record them
+                    # as ignored now instead of growing the queue with them.
+                    crawlable_urls = []
+                    ignored_urls = []
+                    for url in new_urls:
+                        url_action = _classify_url(
+                            url, base_url_netloc, allowed_re, banned_re, visited_urls
                         )
-                        for url in child_urls:
-                            if url.startswith("http"):
-                                queue.put_nowait(
-                                    {
-                                        "url": url,
-                                        "parent_urls": parent_urls + [curr_url],
-                                    }
-                                )
-                    except:
-                        child_urls = []
-                        page_type = "other"
-
-                    visited_urls[curr_url] = filepath
-                    data = {
-                        "crawl_id": crawl_id,
-                        "url": curr_url,
-                        "type": page_type,
-                        "title": page_title,
-                        "date": datetime.now().isoformat(),
-                        "parent_urls": parent_urls,
-                        "child_urls": child_urls,
-                        "html": page_html,
-                        "text": page_text,
-                    }
-                    with open(filepath, "w") as f:
-                        json.dump(data, f)
-
-            elif curr_url not in visited_urls and (
-                urlparse(curr_url).netloc == urlparse(base_url).netloc
-                or any(fnmatch(curr_url, allowed) for allowed in allowed_urls)
-            ):
-                leftover_queue.put_nowait(
-                    {
-                        "url": curr_url,
-                        "parent_urls": parent_urls,
-                    }
-                )
+                        if url_action == _IGNORE_URL:
+                            ignored_urls.append(url)
+                        else:
+                            crawlable_urls.append(url)
+                    ignored_queue.put_many_nowait(ignored_urls)
+                    queue.put_many_nowait((url, curr_entry) for url in crawlable_urls)
+                except:
+                    child_urls = []
+                    page_type = "other"
+                    html_content = None
+
+                visited_urls[curr_url] = filepath
+                data = {
+                    "crawl_id": crawl_id,
+                    "url": curr_url,
+                    "type": page_type,
+                    "title": page_title,
+                    "date": _format_timestamp(int(time.time())),
+                    "parent_urls": _parent_urls(parent),
+                    "child_urls": child_urls,
+                    "html_file": (
+                        os.path.splitext(os.path.basename(filepath))[0] + ".html.gz"
+                        if html_content is not None
+                        else None
+                    ),
+                    "encoding": encoding,
+                    "text": page_text,
+                }
+                # Serialize and write in a thread so other workers keep running meanwhile.
+                await loop.run_in_executor(None, _write_page, filepath, data, html_content)
+
+            elif action != _IGNORE_URL:
+                leftover_queue.put_nowait(curr_entry)
 
             else:
                 ignored_queue.put_nowait(curr_url)
@@ -265,35 +605,51 @@ class Crawl:
         if self.verbose:
             logging.info(f"Starting crawl of {self.base_url}...")
         if self.api_key is None:
-            leftover_queue = asyncio.Queue()
-            ignored_queue = asyncio.Queue()
+            leftover_queue = _CrawlQueue()
+            ignored_queue = _CrawlQueue()
+            seen_urls = set(self.visited_urls)
+            seen_urls.update(url for url, _ in self.queue.peek())
+            page_budget = None
+            if self.max_pages is not None:
+                page_budget = asyncio.Semaphore(max(self.max_pages - len(self.visited_urls), 0))
+            # The patterns are compiled once and shared by every worker.
+            allowed_re = _compile_patterns(self.allowed_urls)
+            banned_re = _compile_patterns(self.banned_urls)
             tasks = []
-            for i in range(self.n_workers):
-                task = asyncio.create_task(
-                    self.crawl_worker(
-                        f"worker-{i}",
-                        self.queue,
-                        self.crawl_id,
-                        self.visited_urls,
-                        self.allowed_urls,
-                        self.failed_urls,
-                        self.banned_urls,
-                        self.output_dir,
-                        self.base_url,
-                        self.max_pages,
-                        leftover_queue,
-                        ignored_queue,
-                        self.verbose,
+            # Each worker has at most one request in flight, so one connection per worker suffices.
+            # With HTTP/2 the requests to a host are multiplexed over a single connection.
+            limits = httpx.Limits(
+                max_connections=self.n_workers, max_keepalive_connections=self.n_workers
+            )
+            async with httpx.AsyncClient(limits=limits, http2=_HTTP2_AVAILABLE) as client:
+                for i in range(self.n_workers):
+                    task = asyncio.create_task(
+                        self.crawl_worker(
+                            f"worker-{i}",
+                            self.queue,
+                            self.crawl_id,
+                            self.visited_urls,
+                            seen_urls,
+                            allowed_re,
+                            self.failed_urls,
+                            banned_re,
+                            self.output_dir,
+                            self.base_url,
+                            page_budget,
+                            leftover_queue,
+                            ignored_queue,
+                            self.verbose,
+                            client,
+                        )
                     )
-                )
-                tasks.append(task)
+                    tasks.append(task)
 
-            await self.queue.join()
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
+                await self.queue.join()
+                # Every worker is idle once the queue is joined, so one sentinel each stops them all.
+                self.queue.put_many_nowait([None] * self.n_workers)
+                await asyncio.gather(*tasks)
             self.queue = leftover_queue
-            self.ignored_urls = list(ignored_queue._queue)
+            self.ignored_urls = ignored_queue.peek()
             self.to_metadata()
         else:
             self.queue_crawl()
@@ -323,16 +679,7 @@ class Crawl:
             list: A list of URLs from the queue.
         """
         if self.api_key is None:
-            urls = []
-            for _ in range(max_pages):
-                try:
-                    url = self.queue.get_nowait()
-                    urls.append(url)
-                except asyncio.QueueEmpty:
-                    break
-            for url in urls:
-                self.queue.put_nowait(url)
-            return urls
+            return [_entry_to_dict(entry) for entry in self.queue.peek(max_pages)]
         else:
             if not self.created:
                 return [self.base_url]
@@ -560,6 +907,10 @@ class Crawl:
         """
         Download the output of the crawl.
         """
+        import shutil
+        import tempfile
+        import zipfile
+
         if self.verbose:
             logging.info(f"Downloading crawl of {self.base_url}...")
 
@@ -582,19 +933,14 @@ class Crawl:
                 with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
                     zip_ref.extractall(tmpdir)
 
+                base_dir = os.path.join(self.output_dir, urlparse(self.base_url).netloc)
+                os.makedirs(base_dir, exist_ok=True)
                 for root, _, files in os.walk(tmpdir):
                     for file in files:
                         if file.endswith(".json"):
                             json_file = os.path.join(root, file)
-                            with open(json_file, "r") as f:
-                                data = json.load(f)
-                            url = data["url"]
-                            base_url_netloc = urlparse(self.base_url).netloc
-                            base_dir = os.path.join(self.output_dir, base_url_netloc)
-                            if not os.path.exists(base_dir):
-                                os.makedirs(base_dir)
-                            filename = urllib.parse.quote_plus(url).replace("/", "_")
-                            filepath = os.path.join(base_dir, filename) + ".json"
+                            data = _read_json(json_file)
+                            filepath = os.path.join(base_dir, _url_filename(data["url"]))
                             shutil.move(json_file, filepath)
 
         logging.info(f"The output of the crawl can be found at: {self.output_dir}")
@@ -613,13 +959,12 @@ class Crawl:
                 "visited_urls": self.visited_urls,
                 "ignored_urls": list(self.ignored_urls),
                 "render_js": self.render_js,
-                "queue": list(self.queue._queue),
+                "queue": [_entry_to_dict(entry) for entry in self.queue.peek()],
                 "banned_urls": self.banned_urls,
                 "allowed_urls": self.allowed_urls,
                 "output_dir": self.output_dir,
             }
-            with open(filename, "w") as file:
-                json.dump(metadata, file)
+            _write_json(filename, metadata)
 
     @staticmethod
     def from_metadata(crawl_id: str, output_dir: str = "webtranspose-out") -> "Crawl":
@@ -634,8 +979,7 @@ class Crawl:
             Crawl: The Crawl object.
         """
         filename = os.path.join(output_dir, f"{crawl_id}.json")
-        with open(filename, "r") as file:
-            metadata = json.load(file)
+        metadata = _read_json(filename)
         crawl = Crawl(
             metadata["base_url"],
             metadata["allowed_urls"],
@@ -648,9 +992,9 @@ class Crawl:
         crawl.crawl_id = metadata["crawl_id"]
         crawl.visited_urls = metadata["visited_urls"]
         crawl.ignored_urls = set(metadata["ignored_urls"])
-        crawl.queue = asyncio.Queue()
-        for url in metadata["queue"]:
-            crawl.queue.put_nowait(url)
+        crawl.queue = _CrawlQueue(
+            _make_entry(entry["url"], entry["parent_urls"]) for entry in metadata["queue"]
+        )
         return crawl
 
     @staticmethod
@@ -748,9 +1092,13 @@ class Crawl:
         if not self.created:
             fn = self.visited_urls[url]
             try:
-                with open(fn, "r") as f:
-                    data = json.load(f)
-                    return data
+                data = _read_json(fn)
+                # The raw HTML of locally crawled pages is stored compressed next to the JSON.
+                if data.get("html_file"):
+                    html_fn = os.path.join(os.path.dirname(fn), data["html_file"])
+                    with gzip.open(html_fn, "rb") as f:
+                        data["html"] = f.read().decode(data["encoding"])
+                return data
             except:
                 logging.error(f"Could not find HTML for URL {url}")
         else:
@@ -782,9 +1130,7 @@ class Crawl:
                 logging.error(f"Could not find child URLs for URL {url}")
                 return None
             try:
-                with open(fn, "r") as f:
-                    data = json.load(f)
-                    return data["child_urls"]
+                return _read_json(fn)["child_urls"]
             except:
                 logging.error(f"Could not find child URLs for URL {url}")
         else:
@@ -833,13 +1179,16 @@ def get_crawl(crawl_id: str, api_key: Optional[str] = None) -> Crawl:
         return Crawl.from_cloud(crawl_id, api_key=api_key)
 
 
-def list_crawls(loc: str = "cloud", api_key: Optional[str] = None) -> list:
+def list_crawls(
+    loc: str = "cloud", api_key: Optional[str] = None, output_dir: str = "webtranspose-out"
+) -> list:
     """
     List all available crawls.
 
     Args:
         loc (str, optional): The location of the crawls. Defaults to 'cloud'.
         api_key (str, optional): The API key. Defaults to None.
+        output_dir (str, optional): The directory of local crawls. Defaults to "webtranspose-out".
 
     Returns:
         list: A list of Crawl objects.
@@ -857,9 +1206,13 @@ def list_crawls(loc: str = "cloud", api_key: Optional[str] = None) -> list:
 
     elif loc == "local" or api_key is None:
         crawls = []
-        for filename in os.listdir("."):
-            if filename.endswith(".json"):
-                crawls.append(Crawl.from_metadata(filename[:-5]))
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        crawls.append(Crawl.from_metadata(entry.name[:-5], output_dir=output_dir))
+        except FileNotFoundError:
+            pass
         return crawls
 
 
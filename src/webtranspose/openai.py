@@ -1,8 +1,116 @@
 import json
+import logging
+import math
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-import openai
-import tiktoken
+if TYPE_CHECKING:
+    import openai
+    import tiktoken
+
+__all__ = [
+    "OpenAIScraper",
+]
+
+# Text longer than this many tokens is sent to the 16k context model.
+_LARGE_TEXT_TOKENS = 2500
+# The most tokens of text batched into one request. Batches stay on the model that a single chunk
+# would use, so batching never moves a page onto the 16k context model.
+_MAX_BATCH_TOKENS = _LARGE_TEXT_TOKENS
+
+
+class _TruncatedReplyError(Exception):
+    """
+    Raised when the model's reply was cut off at the token limit.
+    """
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """
+    Get the tokenizer for a model, shared by all scrapers.
+
+    tiktoken is imported on first use, so importing the package does not load it.
+
+    Args:
+        model (str): The name of the model.
+
+    Returns:
+        tiktoken.Encoding: The encoding used by the model.
+    """
+    import tiktoken
+
+    return tiktoken.encoding_for_model(model)
+
+
+def _transform_schema(schema: dict) -> dict:
+    """
+    Transform the schema into the format required by OpenAI.
+
+    Args:
+        schema (dict): The schema to transform.
+
+    Returns:
+        dict: The transformed schema.
+    """
+    openai_type_map = {
+        "str": "string",
+        "int": "number",
+        "bool": "boolean",
+    }
+
+    properties = {}
+    for key, value in schema.items():
+        if isinstance(value, dict):
+            if "type" in value and value["type"] == "array":
+                properties[key] = {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": _transform_schema(value["items"]),
+                    },
+                    "required": list(value["items"].keys()),
+                }
+            elif "type" in value:
+                properties[key] = value
+            else:
+                properties[key] = _transform_schema(value)
+        elif isinstance(value, list):
+            try:
+                properties[key] = {
+                    "type": openai_type_map[type(value[0]).__name__],
+                    "enum": value,
+                    "description": key,
+                }
+            except IndexError:
+                raise Exception(f"Empty list for key {key}")
+        else:
+            properties[key] = {
+                "type": value,
+                "description": key,
+            }
+
+    return properties
+
+
+@lru_cache(maxsize=128)
+def _transform_schema_json(schema_json: str) -> str:
+    """
+    Transform a JSON serialized schema, caching the result.
+
+    Scrapers that share a schema, or scrape many pages with one, only transform it once. The key
+    keeps the schema's key order, which sets the order of the fields sent to OpenAI.
+
+    Args:
+        schema_json (str): The schema, serialized as JSON.
+
+    Returns:
+        str: The transformed schema, serialized as JSON.
+    """
+    return json.dumps(_transform_schema(json.loads(schema_json)))
 
 
 class OpenAIScraper:
@@ -10,6 +118,9 @@ class OpenAIScraper:
         self,
         chunk_size: int = 2500,
         overlap_size: int = 100,
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        batch_size: int = 1,
     ):
         """
         Initialize the OpenAIScraper.
@@ -17,16 +128,230 @@ class OpenAIScraper:
         Args:
             chunk_size (int, optional): The size of each chunk of text to process. Defaults to 2500.
             overlap_size (int, optional): The size of the overlap between chunks. Defaults to 100.
+            max_concurrency (int, optional): The maximum number of requests sent to OpenAI at once, shared by all pages being scraped concurrently. Defaults to 8.
+            max_retries (int, optional): The number of times a rate limited or failed request is retried with exponential backoff. Defaults to 5.
+            batch_size (int, optional): The maximum number of chunks extracted in a single request. Defaults to 1, which sends each chunk on its own. A batch holds at most 2500 tokens of text so that it stays on the small model, so batching only groups chunks when ``chunk_size`` is at most half of that.
         """
         self.api_key = os.environ.get("OPENAI_API_KEY")
-        self.encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
+        self._encoding = None
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.batch_size = batch_size
+        if batch_size > 1 and 2 * chunk_size > _MAX_BATCH_TOKENS:
+            logging.warning(
+                f"batch_size={batch_size} has no effect with chunk_size={chunk_size}, because a batch holds at most {_MAX_BATCH_TOKENS} tokens. Use a chunk_size of at most {_MAX_BATCH_TOKENS // 2} to batch chunks."
+            )
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._request_slots = threading.BoundedSemaphore(max_concurrency)
+        self._schema_key = None
+        self._prepared_schema = None
+
+    @property
+    def encoding(self) -> "tiktoken.Encoding":
+        """
+        The tokenizer used to split text into chunks, loaded on first use.
+
+        Returns:
+            tiktoken.Encoding: The encoding used by the model.
+        """
+        if self._encoding is None:
+            self._encoding = _get_encoding("gpt-3.5-turbo")
+        return self._encoding
+
+    @encoding.setter
+    def encoding(self, encoding: "tiktoken.Encoding") -> None:
+        self._encoding = encoding
+
+    def _get_client(self) -> "openai.OpenAI":
+        """
+        Get the OpenAI client, creating it on first use.
+
+        The openai package is imported here, so importing the package does not load it.
+
+        Returns:
+            openai.OpenAI: The OpenAI client.
+        """
+        if self._client is None:
+            # Chunks are extracted on several threads, which must not each create a client.
+            with self._client_lock:
+                if self._client is None:
+                    import openai
+
+                    self._client = openai.OpenAI(
+                        api_key=self.api_key, max_retries=self.max_retries
+                    )
+        return self._client
+
+    def _prepare_schema(self, schema: dict) -> Tuple[dict, list, list]:
+        """
+        Build the transformed schema and the function definitions sent to OpenAI.
+
+        The result is reused while the schema is unchanged. The schema is compared by its JSON
+        serialization, so a schema edited in place since the previous scrape is prepared again.
+
+        Args:
+            schema (dict): The schema to prepare.
+
+        Returns:
+            tuple: The transformed schema, the function definitions for a single chunk and the
+                function definitions for a batch of numbered sections.
+        """
+        schema_key = json.dumps(schema)
+        if schema_key != self._schema_key:
+            processed_schema = self.transform_schema(schema)
+            schema_keys = ", ".join(processed_schema.keys())
+            functions = [
+                {
+                    "name": "extract_info",
+                    "description": f"Extract the {schema_keys} from the website text if any exist. Empty if not found.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": processed_schema,
+                        "required": list(processed_schema.keys()),
+                    },
+                },
+            ]
+            batch_functions = [
+                {
+                    "name": "extract_info",
+                    "description": f"Extract the {schema_keys} from each numbered section of the website text if any exist, with one entry per section in order. Empty if not found.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "sections": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": processed_schema,
+                                    "required": list(processed_schema.keys()),
+                                },
+                            },
+                        },
+                        "required": ["sections"],
+                    },
+                },
+            ]
+            self._prepared_schema = (processed_schema, functions, batch_functions)
+            self._schema_key = schema_key
+        return self._prepared_schema
+
+    def _call_model(self, content: str, n_tokens: int, functions: list) -> Optional[dict]:
+        """
+        Ask the model to call the extraction function on some text.
+
+        Args:
+            content (str): The text to extract from.
+            n_tokens (int): The number of tokens in the text.
+            functions (list): The function definitions describing the schema.
+
+        Returns:
+            dict: The function arguments, or None if the model did not call the function.
+
+        Raises:
+            _TruncatedReplyError: If the reply was cut off before the function call was complete.
+        """
+        model = "gpt-3.5-turbo-0613"
+        if n_tokens > _LARGE_TEXT_TOKENS:
+            model = "gpt-3.5-turbo-16k"
+
+        client = self._get_client()
+        # Pages scraped concurrently share the scraper, so this bounds all of their requests.
+        with self._request_slots:
+            response = client.chat.completions.create(
+                model=model,
+                temperature=0,
+                messages=[{"role": "user", "content": content}],
+                functions=functions,
+            )
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            raise _TruncatedReplyError()
+        out = choice.message
+
+        if out.function_call is None:
+            return None
+        return json.loads(out.function_call.arguments)
+
+    def _extract_batch(
+        self, batch: List[Tuple[str, int]], functions: list, batch_functions: list
+    ) -> List[dict]:
+        """
+        Extract the schema fields from a batch of chunks in a single request.
+
+        Args:
+            batch (list): The chunks of text and their token counts.
+            functions (list): The function definitions for a single chunk.
+            batch_functions (list): The function definitions for numbered sections.
+
+        Returns:
+            list: The extracted fields, in chunk order.
+        """
+        if len(batch) == 1:
+            sub_html, n_tokens = batch[0]
+            try:
+                args = self._call_model(sub_html, n_tokens, functions)
+            except _TruncatedReplyError:
+                logging.warning("Skipping a chunk whose extracted data did not fit in the reply.")
+                return []
+            return [] if args is None else [args]
+
+        content = "\n\n".join(
+            f"Section {i}:\n{sub_html}" for i, (sub_html, _) in enumerate(batch, start=1)
+        )
+        try:
+            args = self._call_model(content, sum(n for _, n in batch), batch_functions)
+        except _TruncatedReplyError:
+            # The reply for all of the sections did not fit, so extract each chunk on its own.
+            return [
+                args
+                for chunk in batch
+                for args in self._extract_batch([chunk], functions, batch_functions)
+            ]
+        if args is None:
+            return []
+        return [section for section in args.get("sections", []) if isinstance(section, dict)]
+
+    def _batch_chunks(self, chunks: List[Tuple[str, int]]) -> List[List[Tuple[str, int]]]:
+        """
+        Group consecutive chunks into batches that fit in a single request.
+
+        Chunks large enough to need the 16k context model are sent on their own.
+
+        Args:
+            chunks (list): The chunks of text and their token counts.
+
+        Returns:
+            list: The batches of chunks and their token counts, in chunk order.
+        """
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for sub_html, n_tokens in chunks:
+            if batch and (
+                n_tokens > _LARGE_TEXT_TOKENS
+                or len(batch) >= self.batch_size
+                or batch_tokens + n_tokens > _MAX_BATCH_TOKENS
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append((sub_html, n_tokens))
+            batch_tokens += n_tokens
+            if n_tokens > _LARGE_TEXT_TOKENS:
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+        if batch:
+            batches.append(batch)
+        return batches
 
     @staticmethod
     def process_html(
-        text: str, chunk_size: int, overlap_size: int, encoding: tiktoken.Encoding
-    ) -> list:
+        text: str, chunk_size: int, overlap_size: int, encoding: "tiktoken.Encoding"
+    ) -> List[Tuple[str, int]]:
         """
         Process the HTML text into chunks.
 
@@ -37,18 +362,25 @@ class OpenAIScraper:
             encoding (tiktoken.Encoding): The encoding object.
 
         Returns:
-            list: A list of decoded chunks.
+            list: A list of decoded chunks and the number of tokens in each.
         """
         encoded = encoding.encode(text)
         if overlap_size >= chunk_size:
             raise ValueError("Overlap size should be less than chunk size.")
-        chunks = []
-        idx = 0
-        while idx < len(encoded):
-            end_idx = idx + chunk_size
-            chunks.append(encoded[idx:end_idx])
-            idx = end_idx - overlap_size
-        decoded_chunks = [encoding.decode(chunk) for chunk in chunks]
+        stride = chunk_size - overlap_size
+        # The fewest windows that cover every token. A window that would only repeat the overlap
+        # at the end of the previous one is not produced.
+        n_chunks = max(1, math.ceil((len(encoded) - overlap_size) / stride)) if encoded else 0
+        chunks = [
+            encoded[start : start + chunk_size] for start in range(0, n_chunks * stride, stride)
+        ]
+        if len(chunks) > 1:
+            # Decode the chunks in one call, which tiktoken spreads over a thread pool.
+            num_threads = min(len(chunks), os.cpu_count() or 1)
+            decoded = encoding.decode_batch(chunks, num_threads=num_threads)
+        else:
+            decoded = [encoding.decode(chunk) for chunk in chunks]
+        decoded_chunks = [(sub_text, len(chunk)) for sub_text, chunk in zip(decoded, chunks)]
         return decoded_chunks
 
     def scrape(self, html: str, schema: dict) -> dict:
@@ -62,47 +394,40 @@ class OpenAIScraper:
         Returns:
             dict: The scraped data.
         """
-        processed_schema = self.transform_schema(schema)
-        schema_keys = ", ".join(processed_schema.keys())
+        processed_schema, functions, batch_functions = self._prepare_schema(schema)
+        chunks = self.process_html(html, self.chunk_size, self.overlap_size, self.encoding)
+        batches = self._batch_chunks(chunks)
         out_data = {}
+        filled_keys = set()
+        # Without arrays to collect, later chunks cannot change the result once every scalar has a
+        # value, so the batches that have not been sent yet are cancelled.
+        stop_when_filled = all(v.get("type") != "array" for v in processed_schema.values())
 
-        for sub_html in self.process_html(html, self.chunk_size, self.overlap_size, self.encoding):
-            model = "gpt-3.5-turbo-0613"
-            if len(self.encoding.encode(sub_html)) > 2500:
-                model = "gpt-3.5-turbo-16k"
-
-            response = openai.ChatCompletion.create(
-                model=model,
-                temperature=0,
-                messages=[{"role": "user", "content": sub_html}],
-                functions=[
-                    {
-                        "name": "extract_info",
-                        "description": f"Extract the {schema_keys} from the website text if any exist. Empty if not found.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": processed_schema,
-                            "required": list(processed_schema.keys()),
-                        },
-                    },
-                ],
-            )
-            out = response["choices"][0]["message"]
-
-            if "function_call" in out:
-                args = json.loads(out["function_call"]["arguments"])
-
-                for k in args.keys():
-                    if k in processed_schema:
-                        if processed_schema[k]["type"] == "array":
-                            if k not in out_data:
-                                out_data[k] = []
-                            out_data[k] += args[k]
-                        else:
-                            out_data[k] = args[k]
-                            del processed_schema[k]
-                    elif k not in out_data:
-                        out_data[k] = None
+        # Batches are sent concurrently, but results are merged in chunk order so that arrays keep
+        # the page order and scalars take the value from the first chunk that has one.
+        max_workers = max(1, min(self.max_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self._extract_batch, batch, functions, batch_functions)
+                for batch in batches
+            ]
+            for future in futures:
+                for args in future.result():
+                    for k in args.keys():
+                        if k in processed_schema:
+                            if processed_schema[k]["type"] == "array":
+                                if k not in out_data:
+                                    out_data[k] = []
+                                out_data[k] += args[k]
+                            elif k not in filled_keys:
+                                out_data[k] = args[k]
+                                filled_keys.add(k)
+                        elif k not in out_data:
+                            out_data[k] = None
+                if stop_when_filled and len(filled_keys) == len(processed_schema):
+                    for pending in futures:
+                        pending.cancel()
+                    break
 
         return out_data
 
@@ -116,41 +441,4 @@ class OpenAIScraper:
         Returns:
             dict: The transformed schema.
         """
-        openai_type_map = {
-            "str": "string",
-            "int": "number",
-            "bool": "boolean",
-        }
-
-        properties = {}
-        for key, value in schema.items():
-            if isinstance(value, dict):
-                if "type" in value and value["type"] == "array":
-                    properties[key] = {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": self.transform_schema(value["items"]),
-                        },
-                        "required": list(value["items"].keys()),
-                    }
-                elif "type" in value:
-                    properties[key] = value
-                else:
-                    properties[key] = self.transform_schema(value)
-            elif isinstance(value, list):
-                try:
-                    properties[key] = {
-                        "type": openai_type_map[type(value[0]).__name__],
-                        "enum": value,
-                        "description": key,
-                    }
-                except IndexError:
-                    raise Exception(f"Empty list for key {key}")
-            else:
-                properties[key] = {
-                    "type": value,
-                    "description": key,
-                }
-
-        return properties
+        return json.loads(_transform_schema_json(json.dumps(schema)))
@@ -1,14 +1,96 @@
+import asyncio
 import json
 import logging
 import os
-import re
-import uuid
-
-import requests
-from bs4 import BeautifulSoup
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, List
 
 from .openai import OpenAIScraper
-from .webt_api import run_webt_api
+from .webt_api import run_webt_api, run_webt_api_async
+
+if TYPE_CHECKING:
+    import requests
+
+__all__ = [
+    "Scraper",
+    "get_scraper",
+    "list_scrapers",
+]
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """
+    Get the pooled session used to fetch pages, creating it on first use.
+
+    Pages are fetched through one session so repeated scrapes of a site reuse connections. Fetches
+    are GETs, so rate limited and transient server errors are retried with backoff. requests is
+    imported here, so importing the package does not load it.
+
+    Returns:
+        requests.Session: The session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util import Retry
+
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        raise_on_status=False,
+                    ),
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _extract_body(chunks: Iterable[bytes]) -> str:
+    """
+    Extract the body of an HTML page as markup with its whitespace collapsed.
+
+    The page is fed to the parser incrementally, so the raw page is never held in memory at once.
+
+    Args:
+        chunks (Iterable[bytes]): The raw HTML page, in chunks.
+
+    Returns:
+        str: The markup of the ``<body>`` element, or an empty string if the page has no body.
+    """
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    parser = lxml_html.HTMLParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    try:
+        tree = parser.close()
+    except etree.LxmlError:
+        return ""
+    body = tree.find("body") if tree is not None else None
+    if body is None:
+        return ""
+    body_html = lxml_html.tostring(body, encoding="unicode", with_tail=False)
+    # str.split() treats the same characters as whitespace as the \s regex class, Unicode spaces
+    # included. It scans the string in C, as fast as a byte-level pass over the encoded markup.
+    return " ".join(body_html.split())
 
 
 class Scraper:
@@ -53,8 +135,6 @@ class Scraper:
         self.proxy = proxy
         if self.scraper is None:
             self.scraper = OpenAIScraper()
-        if self.scraper_id is None:
-            self.scraper_id = str(uuid.uuid4())
         self.created = _created
 
         api_key = os.environ.get("WEBTRANSPOSE_API_KEY")
@@ -63,14 +143,32 @@ class Scraper:
                 "No Web Transpose API provided. Lite version in use...\n\nTo run the actual WebT AI Web Scraper the Web Transpose API, set the WEBTRANSPOSE_API_KEY from https://webtranspose.com. Run cheaper with logging and advanced analytics."
             )
 
+    @property
+    def scraper_id(self) -> str:
+        """
+        The ID of the scraper, generated on first use if none was given.
+
+        Returns:
+            str: The ID of the scraper.
+        """
+        if self._scraper_id is None:
+            self._scraper_id = secrets.token_hex(16)
+        return self._scraper_id
+
+    @scraper_id.setter
+    def scraper_id(self, scraper_id: str) -> None:
+        self._scraper_id = scraper_id
+
     def __str__(self) -> str:
         """
         Get a string representation of the Scraper object.
 
+        Only local attributes are used, so printing a Scraper never makes an API request.
+
         Returns:
             str: The string representation of the Scraper object.
         """
-        status = self.status()
+        status = self._local_status()
         schema = json.dumps(status["schema"], indent=4)
         return (
             f"WebTransposeScraper(\n"
@@ -85,10 +183,12 @@ class Scraper:
         """
         Get a string representation of the Scraper object.
 
+        Only local attributes are used, so printing a Scraper never makes an API request.
+
         Returns:
             str: The string representation of the Scraper object.
         """
-        status = self.status()
+        status = self._local_status()
         schema = json.dumps(status["schema"], indent=4)
         return (
             f"WebTransposeScraper(\n"
@@ -140,10 +240,8 @@ class Scraper:
 
         if self.api_key is None:
             if url is not None:
-                response = requests.get(url, timeout=timeout)
-                soup = BeautifulSoup(response.content, "html.parser")
-                body = soup.body
-                html = re.sub("\s+", " ", str(body)).strip()
+                with _get_session().get(url, timeout=timeout, stream=True) as response:
+                    html = _extract_body(response.iter_content(_STREAM_CHUNK_SIZE))
 
             if html is None:
                 raise ValueError("Must provide either a url or html.")
@@ -169,6 +267,108 @@ class Scraper:
             )
             return out_json
 
+    async def scrape_async(self, url=None, html=None, timeout=30):
+        """
+        Scrape the data from a given URL or HTML without blocking the event loop.
+
+        Args:
+            url (str, optional): The URL to scrape. Defaults to None.
+            html (str, optional): The HTML to scrape. Defaults to None.
+            timeout (int, optional): The timeout for the request. Defaults to 30.
+
+        Returns:
+            dict: The scraped data.
+
+        Raises:
+            ValueError: If neither URL nor HTML is provided.
+        """
+        loop = asyncio.get_running_loop()
+        if self.api_key is None:
+            # Local scraping is blocking work, so it runs in the default executor.
+            return await loop.run_in_executor(None, self.scrape, url, html, timeout)
+
+        if self.verbose:
+            logging.info(f"Running Scraper({self.name}) on {url}...")
+
+        if not self.created:
+            await loop.run_in_executor(None, self.create_scraper_api)
+
+        scrape_json = {
+            "scraper_id": self.scraper_id,
+            "url": url,
+            "html": html,
+            "proxy": self.proxy,
+        }
+        out_json = await run_webt_api_async(
+            scrape_json,
+            "/v1/scraper/scrape",
+            self.api_key,
+        )
+        return out_json
+
+    def scrape_many(self, urls: List[str], concurrency: int = 10) -> list:
+        """
+        Scrape the data from several URLs concurrently.
+
+        Without an API key the pages share the OpenAIScraper, whose ``max_concurrency`` bounds the
+        OpenAI requests of all of them together.
+
+        Args:
+            urls (list): The URLs to scrape.
+            concurrency (int, optional): The maximum number of URLs scraped at once. Defaults to 10.
+
+        Returns:
+            list: The scraped data for each URL, in the order of the URLs.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        if self.api_key is not None and not self.created:
+            # Create the scraper once up front rather than once per concurrent scrape.
+            self.create_scraper_api()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls)))) as pool:
+            return list(pool.map(lambda url: self.scrape(url=url), urls))
+
+    async def scrape_many_async(self, urls: List[str], max_concurrency: int = 10) -> list:
+        """
+        Scrape the data from several URLs concurrently.
+
+        Args:
+            urls (list): The URLs to scrape.
+            max_concurrency (int, optional): The maximum number of URLs scraped at once. Defaults to 10.
+
+        Returns:
+            list: The scraped data for each URL, in the order of the URLs.
+        """
+        if self.api_key is not None and not self.created:
+            # Create the scraper once up front rather than once per concurrent scrape.
+            await asyncio.get_running_loop().run_in_executor(None, self.create_scraper_api)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scrape_url(url: str) -> dict:
+            async with semaphore:
+                return await self.scrape_async(url=url)
+
+        return await asyncio.gather(*(scrape_url(url) for url in urls))
+
+    def _local_status(self) -> dict:
+        """
+        Get the status of the Scraper from its local attributes.
+
+        Returns:
+            dict: The status of the Scraper.
+        """
+        return {
+            "scraper_id": self.scraper_id,
+            "name": self.name,
+            "verbose": self.verbose,
+            "render_js": self.render_js,
+            "schema": self.schema,
+            "proxy": self.proxy,
+        }
+
     def status(self):
         """
         Get the status of the Scraper.
@@ -177,14 +377,7 @@ class Scraper:
             dict: The status of the Scraper.
         """
         if self.api_key is None or not self.created:
-            return {
-                "scraper_id": self.scraper_id,
-                "name": self.name,
-                "verbose": self.verbose,
-                "render_js": self.render_js,
-                "schema": self.schema,
-                "proxy": self.proxy,
-            }
+            return self._local_status()
         else:
             get_json = {
                 "scraper_id": self.scraper_id,
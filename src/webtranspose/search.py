@@ -1,18 +1,27 @@
 import os
-import requests
 
 from .webt_api import run_webt_api
 
-def search(query, api_key=None) -> dict:
+__all__ = [
+    "search",
+    "search_filter",
+]
+
+
+def _run_search(query, api_path: str, api_key=None) -> dict:
     """
-    Search for a query using the Web Transpose API.
+    Run a search request against the Web Transpose API.
 
     Args:
         query (str): The query to search for.
+        api_path (str): The API path of the search endpoint.
         api_key (str, optional): The API key to use for authentication. Defaults to None.
 
     Returns:
         dict: The search results.
+
+    Raises:
+        ValueError: If no API key is provided or set in the environment.
     """
     if api_key is None:
         api_key = os.environ.get("WEBTRANSPOSE_API_KEY")
@@ -22,7 +31,7 @@ def search(query, api_key=None) -> dict:
             {
                 "query": query,
             },
-            "/v1/search",
+            api_path,
             api_key,
         )
         return out_json
@@ -30,6 +39,20 @@ def search(query, api_key=None) -> dict:
     raise ValueError("Must provide api_key or set WEBTRANSPOSE_API_KEY in environment variables.")
 
 
+def search(query, api_key=None) -> dict:
+    """
+    Search for a query using the Web Transpose API.
+
+    Args:
+        query (str): The query to search for.
+        api_key (str, optional): The API key to use for authentication. Defaults to None.
+
+    Returns:
+        dict: The search results.
+    """
+    return _run_search(query, "/v1/search", api_key)
+
+
 def search_filter(query, api_key=None) -> dict:
     """
     Search for a query using the Web Transpose API with filtering.
@@ -41,17 +64,4 @@ def search_filter(query, api_key=None) -> dict:
     Returns:
         dict: The filtered search results.
     """
-    if api_key is None:
-        api_key = os.environ.get("WEBTRANSPOSE_API_KEY")
-
-    if api_key is not None:
-        out_json = run_webt_api(
-            {
-                "query": query,
-            },
-            "/v1/search/filter",
-            api_key,
-        )
-        return out_json
-
-    raise ValueError("Must provide api_key or set WEBTRANSPOSE_API_KEY in environment variables.")
\ No newline at end of file
+    return _run_search(query, "/v1/search/filter", api_key)
@@ -1,31 +1,212 @@
+import asyncio
+import atexit
+import importlib.util
+import json
 import os
+import weakref
+from typing import AsyncIterator, Tuple
 from urllib.parse import urljoin
 
-import requests
+import httpx
 
+from .consts import WEBTRANSPOSE_API_URL
 
-def run_webt_api(params: dict, api_path: str, api_key: str = None) -> dict:
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# httpx only speaks HTTP/2 when its optional h2 dependency is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+# Retry failed connection attempts. A request that never connected was never sent, so this is safe
+# for the non-idempotent POST endpoints too.
+_CONNECT_RETRIES = 3
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        limits=_LIMITS, http2=_HTTP2_AVAILABLE, retries=_CONNECT_RETRIES
+    ),
+    timeout=180,
+)
+atexit.register(_CLIENT.close)
+
+# Async connections are bound to the event loop that opened them, so keep one client per loop,
+# along with the generator that closes it when the loop shuts down.
+_AsyncClientEntry = Tuple[httpx.AsyncClient, AsyncIterator[None]]
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncClientEntry]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class WebTransposeAPIError(Exception):
     """
-    Run a WebTranspose API request.
+    Raised when a WebTranspose API request fails.
+
+    Attributes:
+        status_code (int): The HTTP status code of the failed request.
+    """
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__("API request failed with status code: {}".format(status_code))
+        self.status_code = status_code
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, using orjson when it is installed.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """
+    Deserialize a JSON document, using orjson when it is installed.
+
+    Args:
+        data (bytes): The JSON document.
+
+    Returns:
+        The deserialized object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _build_request(params: dict, api_path: str, api_key: str = None) -> Tuple[str, dict, bytes]:
+    """
+    Build the endpoint, headers and body for a WebTranspose API request.
 
     Args:
         params (dict): The parameters for the API request.
         api_path (str): The API path.
         api_key (str, optional): The API key. Defaults to None.
 
+    Returns:
+        tuple: The API endpoint, the request headers and the JSON request body.
+    """
+    if api_key is None:
+        api_key = os.environ.get("WEBTRANSPOSE_API_KEY")
+    headers = {"Content-Type": "application/json"}
+    if api_key is not None:
+        headers["X-API-Key"] = api_key
+    return urljoin(WEBTRANSPOSE_API_URL, api_path), headers, _json_dumps(params)
+
+
+def _parse_response(response: httpx.Response) -> dict:
+    """
+    Parse the response of a WebTranspose API request.
+
+    Args:
+        response (httpx.Response): The API response.
+
     Returns:
         dict: The JSON response from the API.
 
     Raises:
-        Exception: If the API request fails with a non-200 status code.
+        WebTransposeAPIError: If the API request failed with a non-200 status code.
     """
-    WEBTRANSPOSE_API_URL = "https://api.webtranspose.com/"
-    if api_key is None:
-        api_key = os.environ.get("WEBTRANSPOSE_API_KEY")
-    headers = {"X-API-Key": api_key}
-    api_endpoint = urljoin(WEBTRANSPOSE_API_URL, api_path)
-    response = requests.post(api_endpoint, headers=headers, json=params, timeout=180)
     if response.status_code == 200:
-        return response.json()
+        return _json_loads(response.content)
     else:
-        raise Exception("API request failed with status code: {}".format(response.status_code))
+        raise WebTransposeAPIError(response.status_code)
+
+
+async def _close_on_shutdown(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    """
+    Close an async client when the event loop that uses it shuts down.
+
+    Once started, the generator is tracked by the running loop. ``asyncio.run()`` closes every
+    tracked generator before closing the loop, which runs the ``finally`` block.
+
+    Args:
+        client (httpx.AsyncClient): The client to close.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+async def _get_async_client() -> httpx.AsyncClient:
+    """
+    Get the pooled async client for the running event loop.
+
+    The client is closed when the loop is shut down by ``asyncio.run()``, or by
+    ``loop.shutdown_asyncgens()`` for loops managed by hand.
+
+    Returns:
+        httpx.AsyncClient: The async client.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC_CLIENTS.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                limits=_LIMITS, http2=_HTTP2_AVAILABLE, retries=_CONNECT_RETRIES
+            ),
+            timeout=180,
+        )
+        closer = _close_on_shutdown(client)
+        await closer.__anext__()
+        # The loop only holds a weak reference to the generator, so keep it with the client.
+        entry = _ASYNC_CLIENTS[loop] = (client, closer)
+    return entry[0]
+
+
+def run_webt_api(
+    params: dict, api_path: str, api_key: str = None, *, timeout: float = 180
+) -> dict:
+    """
+    Run a WebTranspose API request.
+
+    Requests share a single pooled client so that repeated calls reuse open connections.
+
+    Args:
+        params (dict): The parameters for the API request.
+        api_path (str): The API path.
+        api_key (str, optional): The API key. Defaults to None.
+        timeout (float, optional): The request timeout in seconds. Defaults to 180.
+
+    Returns:
+        dict: The JSON response from the API.
+
+    Raises:
+        WebTransposeAPIError: If the API request fails with a non-200 status code.
+    """
+    api_endpoint, headers, content = _build_request(params, api_path, api_key)
+    response = _CLIENT.post(api_endpoint, headers=headers, content=content, timeout=timeout)
+    return _parse_response(response)
+
+
+async def run_webt_api_async(
+    params: dict, api_path: str, api_key: str = None, *, timeout: float = 180
+) -> dict:
+    """
+    Run a WebTranspose API request without blocking the event loop.
+
+    Args:
+        params (dict): The parameters for the API request.
+        api_path (str): The API path.
+        api_key (str, optional): The API key. Defaults to None.
+        timeout (float, optional): The request timeout in seconds. Defaults to 180.
+
+    Returns:
+        dict: The JSON response from the API.
+
+    Raises:
+        WebTransposeAPIError: If the API request fails with a non-200 status code.
+    """
+    api_endpoint, headers, content = _build_request(params, api_path, api_key)
+    client = await _get_async_client()
+    response = await client.post(api_endpoint, headers=headers, content=content, timeout=timeout)
+    return _parse_response(response)
@@ -0,0 +1,219 @@
+"""Tests for `webtranspose.chat` module."""
+import asyncio
+from typing import Callable, List
+
+import pytest
+
+from webtranspose import chat as chat_module
+
+
+def fake_statuses(statuses: List[str]) -> Callable:
+    """Answer chatbot status requests with each of ``statuses`` in turn, then the last one."""
+    remaining = list(statuses)
+
+    def run_webt_api(params: dict, api_path: str, api_key=None, *, timeout: float = 180) -> dict:
+        assert api_path == "v1/chat/get"
+        status = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return {"chatbot": {"id": params["chatbot_id"], "status": status}}
+
+    return run_webt_api
+
+
+def test_poll_for_complete_sees_status_at_deadline(monkeypatch) -> None:
+    monkeypatch.setattr(chat_module, "run_webt_api", fake_statuses(["pending", "complete"]))
+    chatbot = chat_module.Chatbot(chatbot_id="chatbot", api_key="key")
+
+    chatbot._poll_for_complete(timeout=0.2)
+
+    assert chatbot.created
+
+
+def test_poll_for_complete_times_out(monkeypatch) -> None:
+    monkeypatch.setattr(chat_module, "run_webt_api", fake_statuses(["pending"]))
+    chatbot = chat_module.Chatbot(chatbot_id="chatbot", api_key="key")
+
+    with pytest.raises(TimeoutError):
+        chatbot._poll_for_complete(timeout=0.2)
+
+
+def test_async_poll_for_complete_sees_status_at_deadline(monkeypatch) -> None:
+    run_webt_api = fake_statuses(["pending", "complete"])
+
+    async def run_webt_api_async(*args, **kwargs) -> dict:
+        return run_webt_api(*args, **kwargs)
+
+    monkeypatch.setattr(chat_module, "run_webt_api_async", run_webt_api_async)
+    chatbot = chat_module.AsyncChatbot(chatbot_id="chatbot", api_key="key")
+
+    asyncio.run(chatbot._poll_for_complete(timeout=0.2))
+
+    assert chatbot.created
+
+
+def test_create_falls_back_to_polling_without_wait_endpoint(monkeypatch) -> None:
+    requests = []
+
+    def run_webt_api(params: dict, api_path: str, api_key=None, *, timeout: float = 180) -> dict:
+        requests.append(api_path)
+        if api_path == "v1/chat/create":
+            return {"chatbot_id": "chatbot"}
+        if api_path == "v1/chat/wait":
+            raise chat_module.WebTransposeAPIError(405)
+        return {"chatbot": {"id": params["chatbot_id"], "status": "complete"}}
+
+    monkeypatch.setattr(chat_module, "_wait_supported", True)
+    monkeypatch.setattr(chat_module, "run_webt_api", run_webt_api)
+
+    chat_module.Chatbot(url_list=["https://example.com"], api_key="key")
+    chat_module.Chatbot(url_list=["https://example.com"], api_key="key")
+
+    assert requests == [
+        "v1/chat/create",
+        "v1/chat/wait",
+        "v1/chat/get",
+        "v1/chat/create",
+        "v1/chat/get",
+    ]
+
+
+def test_wait_endpoint_kept_after_auth_and_server_errors(monkeypatch) -> None:
+    monkeypatch.setattr(chat_module, "_wait_supported", True)
+
+    assert chat_module._wait_failed(chat_module.WebTransposeAPIError(403))
+    assert chat_module._wait_supported
+    assert not chat_module._wait_failed(chat_module.WebTransposeAPIError(500))
+    assert chat_module._wait_supported
+
+
+def test_query_cache_is_not_shared_between_api_keys(monkeypatch) -> None:
+    requests = []
+
+    def run_webt_api(params: dict, api_path: str, api_key=None, *, timeout: float = 180) -> dict:
+        requests.append(api_key)
+        return {"results": [api_key]}
+
+    monkeypatch.setattr(chat_module, "_query_cache", chat_module.OrderedDict())
+    monkeypatch.setattr(chat_module, "run_webt_api", run_webt_api)
+    owner = chat_module.Chatbot(chatbot_id="chatbot", api_key="owner")
+    other = chat_module.Chatbot(chatbot_id="chatbot", api_key="other")
+
+    assert owner.query_database("query") == ["owner"]
+    assert owner.query_database("query") == ["owner"]
+    assert other.query_database("query") == ["other"]
+    assert requests == ["owner", "other"]
+
+
+def test_async_concurrent_first_use_creates_one_chatbot(monkeypatch) -> None:
+    requests = []
+
+    async def run_webt_api_async(
+        params: dict, api_path: str, api_key=None, *, timeout: float = 180
+    ) -> dict:
+        requests.append(api_path)
+        await asyncio.sleep(0.01)
+        if api_path == "v1/chat/create":
+            return {"chatbot_id": f"chatbot-{len(requests)}"}
+        if api_path == "v1/chat/wait":
+            return {"chatbot": {"id": params["chatbot_id"], "status": "complete"}}
+        return {"results": [params["query"]]}
+
+    monkeypatch.setattr(chat_module, "_wait_supported", True)
+    monkeypatch.setattr(chat_module, "_query_cache", chat_module.OrderedDict())
+    monkeypatch.setattr(chat_module, "run_webt_api_async", run_webt_api_async)
+    chatbot = chat_module.AsyncChatbot(url_list=["https://example.com"], api_key="key")
+
+    async def query_concurrently() -> list:
+        return await asyncio.gather(*(chatbot.query_database(f"q{i}") for i in range(3)))
+
+    assert asyncio.run(query_concurrently()) == [["q0"], ["q1"], ["q2"]]
+    assert requests.count("v1/chat/create") == 1
+    assert requests.count("v1/chat/wait") == 1
+    assert chatbot.chatbot_id == "chatbot-1"
+
+
+def test_unique_chunks_drops_duplicates_and_splits() -> None:
+    url_lists = [["a", "b", "a"], ["c", "b", "d"], ["e"]]
+
+    assert list(chat_module._unique_chunks(url_lists, 2)) == [["a", "b"], ["c", "d"], ["e"]]
+    assert list(chat_module._unique_chunks([], 2)) == []
+
+
+def test_add_urls_bulk_sends_unique_urls_in_chunks(monkeypatch) -> None:
+    requests = []
+
+    def run_webt_api(params: dict, api_path: str, api_key=None, *, timeout: float = 180) -> dict:
+        requests.append((api_path, params.get("url_list")))
+        return {}
+
+    monkeypatch.setattr(chat_module, "run_webt_api", run_webt_api)
+    chatbot = chat_module.Chatbot(chatbot_id="chatbot", api_key="key")
+
+    chatbot.add_urls_bulk([["a", "b"], ["b", "c", "a"], ["d"]], chunk_size=2)
+
+    assert requests == [("v1/chat/urls/add", ["a", "b"]), ("v1/chat/urls/add", ["c", "d"])]
+
+
+def test_async_add_urls_bulk_sends_unique_urls_in_chunks(monkeypatch) -> None:
+    requests = []
+
+    async def run_webt_api_async(
+        params: dict, api_path: str, api_key=None, *, timeout: float = 180
+    ) -> dict:
+        requests.append((api_path, params.get("url_list")))
+        return {}
+
+    monkeypatch.setattr(chat_module, "run_webt_api_async", run_webt_api_async)
+    chatbot = chat_module.AsyncChatbot(chatbot_id="chatbot", api_key="key")
+
+    asyncio.run(chatbot.add_urls_bulk([["a", "b"], ["b", "c", "a"], ["d"]], chunk_size=2))
+
+    assert sorted(requests) == [
+        ("v1/chat/urls/add", ["a", "b"]),
+        ("v1/chat/urls/add", ["c", "d"]),
+    ]
+
+
+def test_status_is_cached_until_ttl_expires(monkeypatch) -> None:
+    now = [100.0]
+    run_webt_api = fake_statuses(["pending", "pending", "complete"])
+    requests = []
+
+    def counting_run_webt_api(*args, **kwargs) -> dict:
+        requests.append(args[1])
+        return run_webt_api(*args, **kwargs)
+
+    monkeypatch.setattr(chat_module, "monotonic", lambda: now[0])
+    monkeypatch.setattr(chat_module, "run_webt_api", counting_run_webt_api)
+    chatbot = chat_module.Chatbot(chatbot_id="chatbot", api_key="key")
+
+    assert chatbot.status()["status"] == "pending"
+    now[0] += chat_module._STATUS_TTL / 2
+    assert chatbot.status()["status"] == "pending"
+    assert len(requests) == 1
+
+    assert chatbot.status(force=True)["status"] == "pending"
+    assert len(requests) == 2
+
+    now[0] += chat_module._STATUS_TTL
+    assert chatbot.status()["status"] == "complete"
+    assert len(requests) == 3
+    assert chatbot.created
+
+
+def test_status_cache_is_invalidated_by_changes(monkeypatch) -> None:
+    requests = []
+
+    def run_webt_api(params: dict, api_path: str, api_key=None, *, timeout: float = 180) -> dict:
+        requests.append(api_path)
+        return {"chatbot": {"id": params["chatbot_id"], "status": "complete"}}
+
+    monkeypatch.setattr(chat_module, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(chat_module, "run_webt_api", run_webt_api)
+    chatbot = chat_module.Chatbot(chatbot_id="chatbot", api_key="key")
+
+    chatbot.status()
+    chatbot.status()
+    chatbot.add_urls(["https://example.com"])
+    chatbot.status()
+
+    assert requests == ["v1/chat/get", "v1/chat/urls/add", "v1/chat/get"]
@@ -0,0 +1,215 @@
+"""Tests for `webtranspose.crawl` module."""
+import asyncio
+import functools
+import gc
+from typing import Dict, Tuple
+
+import httpx
+import pytest
+from lxml import etree
+
+from webtranspose import crawl as crawl_module
+
+BASE_URL = "https://example.com/"
+
+
+def run_crawl(monkeypatch, tmp_path, pages: Dict[str, Tuple[bytes, str]], **kwargs):
+    """Crawl fixture pages served by a mock transport instead of the network."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        content, content_type = pages[str(request.url)]
+        return httpx.Response(200, content=content, headers={"Content-Type": content_type})
+
+    monkeypatch.delenv("WEBTRANSPOSE_API_KEY", raising=False)
+    monkeypatch.setattr(
+        crawl_module.httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    crawl = crawl_module.Crawl(BASE_URL, output_dir=str(tmp_path), **kwargs)
+    return asyncio.run(crawl.crawl())
+
+
+@pytest.fixture
+def utf8_page() -> bytes:
+    """A UTF-8 page that only declares its charset in the response headers."""
+    return (
+        "<html><head><title>café</title></head><body>"
+        "<p>naïve €</p>"
+        '<a href="/about#team">About</a>'
+        '<a href="https://other.example.org/x">Elsewhere</a>'
+        "</body></html>"
+    ).encode("utf-8")
+
+
+def test_crawl_decodes_page_with_response_charset(monkeypatch, tmp_path, utf8_page) -> None:
+    crawl = run_crawl(monkeypatch, tmp_path, {BASE_URL: (utf8_page, "text/html")}, max_pages=1)
+
+    page = crawl.get_page(BASE_URL)
+    assert page["type"] == "html"
+    assert page["title"] == "café"
+    assert "naïve €" in page["text"]
+
+
+def test_crawl_extracts_links(monkeypatch, tmp_path, utf8_page) -> None:
+    crawl = run_crawl(monkeypatch, tmp_path, {BASE_URL: (utf8_page, "text/html")}, max_pages=1)
+
+    page = crawl.get_page(BASE_URL)
+    assert sorted(page["child_urls"]) == [
+        "https://example.com/about",
+        "https://other.example.org/x",
+    ]
+    assert [entry["url"] for entry in crawl.get_queued()] == ["https://example.com/about"]
+    assert crawl.ignored_urls == ["https://other.example.org/x"]
+
+
+def test_get_page_reads_compressed_html(monkeypatch, tmp_path, utf8_page) -> None:
+    crawl = run_crawl(monkeypatch, tmp_path, {BASE_URL: (utf8_page, "text/html")}, max_pages=1)
+
+    stored = crawl_module._read_json(crawl.visited_urls[BASE_URL])
+    assert "html" not in stored
+    assert stored["html_file"].endswith(".html.gz")
+
+    page = crawl.get_page(BASE_URL)
+    assert page["html"] == utf8_page.decode("utf-8")
+
+
+def test_crawl_decodes_page_with_declared_charset(monkeypatch, tmp_path) -> None:
+    content = "<html><head><title>Crème brûlée</title></head><body>déjà vu</body></html>"
+    pages = {BASE_URL: (content.encode("latin-1"), "text/html; charset=iso-8859-1")}
+    crawl = run_crawl(monkeypatch, tmp_path, pages, max_pages=1)
+
+    page = crawl.get_page(BASE_URL)
+    assert page["encoding"] == "iso-8859-1"
+    assert page["title"] == "Crème brûlée"
+    assert "déjà vu" in page["text"]
+    assert page["html"] == content
+
+
+def test_crawl_does_not_keep_parsed_pages_alive(monkeypatch, tmp_path, utf8_page) -> None:
+    crawl_module._resolve_url.cache_clear()
+    run_crawl(monkeypatch, tmp_path, {BASE_URL: (utf8_page, "text/html")}, max_pages=1)
+    gc.collect()
+
+    # lxml's smart strings reference their whole document, so none may outlive the crawl in the
+    # URL cache or the crawl state.
+    assert not any(type(obj) is etree._ElementUnicodeResult for obj in gc.get_objects())
+
+
+def test_crawl_compiles_url_patterns_once(monkeypatch, tmp_path, utf8_page) -> None:
+    compiled = []
+    compile_patterns = crawl_module._compile_patterns
+
+    def counting_compile_patterns(patterns):
+        compiled.append(patterns)
+        return compile_patterns(patterns)
+
+    monkeypatch.setattr(crawl_module, "_compile_patterns", counting_compile_patterns)
+    run_crawl(
+        monkeypatch,
+        tmp_path,
+        {BASE_URL: (utf8_page, "text/html")},
+        max_pages=1,
+        n_workers=3,
+        allowed_urls=["https://other.example.org/*"],
+        banned_urls=["https://example.com/private/*"],
+    )
+
+    assert compiled == [["https://other.example.org/*"], ["https://example.com/private/*"]]
+
+
+def test_classify_url() -> None:
+    allowed_re = crawl_module._compile_patterns(["https://other.example.org/*"])
+    banned_re = crawl_module._compile_patterns(["https://example.com/private/*"])
+    visited_urls = {"https://example.com/seen": "seen.json"}
+
+    def classify(url: str) -> int:
+        return crawl_module._classify_url(url, "example.com", allowed_re, banned_re, visited_urls)
+
+    assert classify("https://example.com/about") == crawl_module._CRAWL_URL
+    assert classify("https://example.com/private/x") == crawl_module._DEFER_URL
+    assert classify("https://other.example.org/x") == crawl_module._CRAWL_URL
+    assert classify("https://elsewhere.example.net/x") == crawl_module._IGNORE_URL
+    assert classify("https://example.com/seen") == crawl_module._IGNORE_URL
+
+
+def test_classify_url_allowed_overrides_banned() -> None:
+    allowed_re = crawl_module._compile_patterns(["https://example.com/private/ok"])
+    banned_re = crawl_module._compile_patterns(["https://example.com/private/*"])
+
+    action = crawl_module._classify_url(
+        "https://example.com/private/ok", "example.com", allowed_re, banned_re, {}
+    )
+
+    assert action == crawl_module._CRAWL_URL
+
+
+def test_crawl_queue_wakes_one_getter_per_item_of_a_batch() -> None:
+    async def main() -> list:
+        queue = crawl_module._CrawlQueue()
+        getters = [asyncio.create_task(queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        queue.put_many_nowait(["a", "b"])
+        await asyncio.sleep(0)
+        done = [getter.result() for getter in getters if getter.done()]
+        queue.put_nowait("c")
+        done.append(await getters[2])
+        return done
+
+    assert asyncio.run(main()) == ["a", "b", "c"]
+
+
+def test_crawl_queue_passes_wakeup_on_when_getter_is_cancelled() -> None:
+    async def main() -> str:
+        queue = crawl_module._CrawlQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        # The first getter is woken for the item but cancelled before it can take it.
+        queue.put_nowait("item")
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        result = await asyncio.wait_for(second, timeout=1)
+        assert queue.empty()
+        return result
+
+    assert asyncio.run(main()) == "item"
+
+
+def test_crawl_queue_cancelled_getter_does_not_take_items() -> None:
+    async def main() -> list:
+        queue = crawl_module._CrawlQueue()
+        cancelled = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        queue.put_nowait("item")
+        return queue.peek()
+
+    assert asyncio.run(main()) == ["item"]
+
+
+def test_crawl_queue_join_after_sentinels() -> None:
+    async def worker(queue: crawl_module._CrawlQueue, seen: list) -> None:
+        while True:
+            item = await queue.get()
+            queue.task_done()
+            if item is None:
+                return
+            seen.append(item)
+
+    async def main() -> list:
+        seen = []
+        queue = crawl_module._CrawlQueue(["a", "b", "c"])
+        workers = [asyncio.create_task(worker(queue, seen)) for _ in range(2)]
+        await queue.join()
+        queue.put_many_nowait([None] * len(workers))
+        await asyncio.gather(*workers)
+        await asyncio.wait_for(queue.join(), timeout=1)
+        with pytest.raises(ValueError):
+            queue.task_done()
+        return seen
+
+    assert asyncio.run(main()) == ["a", "b", "c"]
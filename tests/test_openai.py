@@ -0,0 +1,134 @@
+"""Tests for `webtranspose.openai` module."""
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import List
+
+import openai
+
+from webtranspose.openai import OpenAIScraper
+
+SCHEMA = {"words": {"type": "array", "items": {"word": "str"}}}
+
+
+class FakeEncoding:
+    """A tokenizer with one token per character."""
+
+    def encode(self, text: str) -> List[int]:
+        return [ord(c) for c in text]
+
+    def decode(self, tokens: List[int]) -> str:
+        return "".join(map(chr, tokens))
+
+    def decode_batch(self, batch: List[List[int]], num_threads: int = 8) -> List[str]:
+        return [self.decode(tokens) for tokens in batch]
+
+
+class FakeClient:
+    """An OpenAI client that extracts the first word of each chunk or numbered section."""
+
+    def __init__(self, truncate_sections: bool = False) -> None:
+        self.truncate_sections = truncate_sections
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model: str, temperature: float, messages: list, functions: list):
+        content = messages[0]["content"]
+        self.requests.append((model, content))
+        sections = re.split(r"Section \d+:\n", content)[1:]
+        if sections and self.truncate_sections:
+            return self.reply({}, finish_reason="length")
+        if sections:
+            args = {"sections": [{"words": [{"word": s.split()[0]}]} for s in sections]}
+        else:
+            args = {"words": [{"word": content.split()[0]}]}
+        return self.reply(args)
+
+    @staticmethod
+    def reply(args: dict, finish_reason: str = "function_call"):
+        message = SimpleNamespace(function_call=SimpleNamespace(arguments=json.dumps(args)))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message, finish_reason=finish_reason)]
+        )
+
+
+def make_scraper(client: FakeClient, **kwargs) -> OpenAIScraper:
+    scraper = OpenAIScraper(chunk_size=10, overlap_size=0, **kwargs)
+    scraper.encoding = FakeEncoding()
+    scraper._client = client
+    return scraper
+
+
+def test_scrape_sends_each_chunk_to_the_small_model_by_default() -> None:
+    client = FakeClient()
+    scraper = make_scraper(client)
+
+    out = scraper.scrape("alpha aaa bravo bbb charlie c", SCHEMA)
+
+    assert out == {"words": [{"word": "alpha"}, {"word": "bravo"}, {"word": "charlie"}]}
+    assert len(client.requests) == 3
+    assert {model for model, _ in client.requests} == {"gpt-3.5-turbo-0613"}
+    assert not any("Section" in content for _, content in client.requests)
+
+
+def test_scrape_extracts_chunks_alone_when_batched_reply_is_cut_off() -> None:
+    client = FakeClient(truncate_sections=True)
+    scraper = make_scraper(client, batch_size=3)
+
+    out = scraper.scrape("alpha aaa bravo bbb charlie c", SCHEMA)
+
+    assert out == {"words": [{"word": "alpha"}, {"word": "bravo"}, {"word": "charlie"}]}
+    assert len(client.requests) == 4
+    assert "Section 3:" in client.requests[0][1]
+
+
+def test_concurrent_scrapes_share_one_client_and_request_bound(monkeypatch) -> None:
+    in_flight = [0, 0]
+    lock = threading.Lock()
+    clients = []
+
+    class SlowClient(FakeClient):
+        def create(self, *args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return super().create(*args, **kwargs)
+
+    def make_client(**kwargs) -> SlowClient:
+        time.sleep(0.01)
+        clients.append(SlowClient())
+        return clients[-1]
+
+    monkeypatch.setattr(openai, "OpenAI", make_client)
+    scraper = OpenAIScraper(chunk_size=10, overlap_size=0, max_concurrency=2)
+    scraper.encoding = FakeEncoding()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pages = [f"page{i} aaaa bravo bbb charlie c" for i in range(4)]
+        results = list(pool.map(lambda page: scraper.scrape(page, SCHEMA), pages))
+
+    assert [out["words"][0]["word"] for out in results] == ["page0", "page1", "page2", "page3"]
+    assert len(clients) == 1
+    assert in_flight[1] == 2
+
+
+def test_batch_chunks_groups_small_chunks() -> None:
+    scraper = OpenAIScraper(chunk_size=600, overlap_size=0, batch_size=4)
+    chunks = [(f"chunk{i}", 600) for i in range(9)]
+
+    batches = scraper._batch_chunks(chunks)
+
+    assert [len(batch) for batch in batches] == [4, 4, 1]
+    assert [chunk for batch in batches for chunk in batch] == chunks
+
+
+def test_batching_with_full_size_chunks_warns(caplog) -> None:
+    OpenAIScraper(batch_size=4)
+
+    assert "has no effect" in caplog.text
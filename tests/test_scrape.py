@@ -0,0 +1,43 @@
+"""Tests for `webtranspose.scrape` module."""
+import threading
+import time
+
+from webtranspose import scrape as scrape_module
+
+SCHEMA = {"title": "str"}
+
+
+def test_scrape_many_creates_once_and_keeps_order(monkeypatch) -> None:
+    requests = []
+    lock = threading.Lock()
+
+    def run_webt_api(params: dict, api_path: str, api_key=None, **kwargs) -> dict:
+        with lock:
+            requests.append(api_path)
+        if api_path == "/v1/scraper/create":
+            time.sleep(0.01)
+            return {"scraper_id": "scraper"}
+        assert params["scraper_id"] == "scraper"
+        # Later URLs finish first, so the results only keep their order if it is restored.
+        time.sleep(0.01 * (5 - int(params["url"][-1])))
+        return {"title": params["url"]}
+
+    monkeypatch.setattr(scrape_module, "run_webt_api", run_webt_api)
+    scraper = scrape_module.Scraper(SCHEMA, api_key="key")
+    urls = [f"https://example.com/{i}" for i in range(5)]
+
+    results = scraper.scrape_many(urls, concurrency=5)
+
+    assert results == [{"title": url} for url in urls]
+    assert requests.count("/v1/scraper/create") == 1
+    assert requests.count("/v1/scraper/scrape") == 5
+    assert scraper.created
+
+
+def test_scrape_many_without_urls_does_not_create(monkeypatch) -> None:
+    requests = []
+    monkeypatch.setattr(scrape_module, "run_webt_api", lambda *args, **kwargs: requests.append(1))
+    scraper = scrape_module.Scraper(SCHEMA, api_key="key")
+
+    assert scraper.scrape_many([]) == []
+    assert requests == []
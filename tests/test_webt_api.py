@@ -0,0 +1,17 @@
+"""Tests for `webtranspose.webt_api` module."""
+import asyncio
+
+from webtranspose import webt_api
+
+
+def test_async_client_is_reused_within_a_loop_and_closed_with_it() -> None:
+    async def get_clients() -> tuple:
+        return await webt_api._get_async_client(), await webt_api._get_async_client()
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+    assert first.is_closed
+
+    (third, _) = asyncio.run(get_clients())
+    assert third is not first
+    assert third.is_closed